@@ -2,15 +2,24 @@
 
 import sys
 from pathlib import Path
+from typing import Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import streamlit as st
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.analysis.compare import filter_shafts
-from src.ingestion.load_data import load_database_df
+from src.analysis.compare import filter_mask
+from src.ingestion.load_data import (
+    database_mtime_ns,
+    ensure_database,
+    load_database_df,
+    load_filter_options,
+)
 
 st.set_page_config(
     page_title="Golf Shaft Analytics",
@@ -22,14 +31,56 @@ st.title("⛳ Golf Shaft Analytics")
 st.markdown("Search, filter, and compare golf shaft specifications across manufacturers.")
 
 
-@st.cache_data
 def get_data() -> pd.DataFrame:
-    from src.ingestion.load_data import DB_FILE, main as build_db
-    if not DB_FILE.exists():
-        build_db()
+    ensure_database()
     return load_database_df()
 
 
+@st.cache_data(max_entries=64)
+def get_filter_mask(
+    mtime_ns: int,
+    manufacturers: tuple[str, ...],
+    club_types: tuple[str, ...],
+    flexes: tuple[str, ...],
+    weight_min: Optional[float],
+    weight_max: Optional[float],
+    torque_min: Optional[float],
+    torque_max: Optional[float],
+    launch_profiles: tuple[str, ...],
+    spin_profiles: tuple[str, ...],
+    price_max: Optional[float],
+) -> Optional[np.ndarray]:
+    """
+    Boolean row mask for the filters (None if none are active), cached on the
+    filter values and database version.
+
+    Only the mask is cached: st.cache_data returns a copy of its value on every
+    hit, which for a whole frame would cost more than the filtering saves.
+    """
+    return filter_mask(
+        get_data(),
+        manufacturers=list(manufacturers) or None,
+        club_types=list(club_types) or None,
+        flexes=list(flexes) or None,
+        weight_min=weight_min,
+        weight_max=weight_max,
+        torque_min=torque_min,
+        torque_max=torque_max,
+        launch_profiles=list(launch_profiles) or None,
+        spin_profiles=list(spin_profiles) or None,
+        price_max=price_max,
+    )
+
+
+# Each entry holds a whole CSV export, so keep only the last few
+@st.cache_data(max_entries=4)
+def to_csv_bytes(frame: pd.DataFrame) -> bytes:
+    """Serialize a frame to CSV with pyarrow's multi-threaded writer."""
+    buf = pa.BufferOutputStream()
+    pacsv.write_csv(pa.Table.from_pandas(frame, preserve_index=False), buf)
+    return buf.getvalue().to_pybytes()
+
+
 df = get_data()
 
 if df.empty:
@@ -38,18 +89,20 @@ if df.empty:
     )
     st.stop()
 
+filter_options = load_filter_options()
+
 # --- Sidebar Filters ---
 st.sidebar.header("🔍 Filters")
 
 manufacturers = st.sidebar.multiselect(
     "Manufacturer",
-    options=sorted(df["manufacturer"].unique()),
+    options=filter_options["manufacturers"],
     default=[],
 )
 
 club_types = st.sidebar.multiselect(
     "Club Type",
-    options=sorted(df["club_type"].unique()),
+    options=filter_options["club_types"],
     default=[],
 )
 
@@ -90,19 +143,20 @@ price_max = st.sidebar.number_input(
 )
 
 # --- Apply Filters ---
-filtered = filter_shafts(
-    df,
-    manufacturers=manufacturers or None,
-    club_types=club_types or None,
-    flexes=flexes or None,
-    weight_min=weight_min if weight_min > 0 else None,
-    weight_max=weight_max if weight_max < 300 else None,
-    torque_min=torque_min if torque_min > 0 else None,
-    torque_max=torque_max if torque_max < 15 else None,
-    launch_profiles=launch_profiles or None,
-    spin_profiles=spin_profiles or None,
-    price_max=price_max if price_max < 500 else None,
+mask = get_filter_mask(
+    database_mtime_ns(),
+    tuple(manufacturers),
+    tuple(club_types),
+    tuple(flexes),
+    weight_min if weight_min > 0 else None,
+    weight_max if weight_max < 300 else None,
+    torque_min if torque_min > 0 else None,
+    torque_max if torque_max < 15 else None,
+    tuple(launch_profiles),
+    tuple(spin_profiles),
+    price_max if price_max < 500 else None,
 )
+filtered = df if mask is None else df.loc[mask]
 
 # --- Display Results ---
 st.markdown(f"### Showing {len(filtered)} of {len(df)} shafts")
@@ -116,7 +170,7 @@ display_cols = [
 available_cols = [c for c in display_cols if c in filtered.columns]
 
 st.dataframe(
-    filtered[available_cols].sort_values(["manufacturer", "model", "weight_grams"]),
+    filtered.sort_values(["manufacturer", "model", "weight_grams"])[available_cols],
     use_container_width=True,
     hide_index=True,
     column_config={
@@ -140,7 +194,7 @@ st.dataframe(
 st.markdown("---")
 col_a, col_b, _ = st.columns([1, 1, 3])
 with col_a:
-    csv_data = filtered[available_cols].to_csv(index=False)
+    csv_data = to_csv_bytes(filtered[available_cols])
     st.download_button("📥 Download CSV", csv_data, "shaft_specs.csv", "text/csv")
 with col_b:
     json_data = filtered[available_cols].to_json(orient="records", indent=2)
@@ -3,73 +3,75 @@
 import sys
 from pathlib import Path
 
+import plotly.graph_objects as go
 import streamlit as st
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.analysis.compare import compare_shafts
-from src.ingestion.load_data import load_database
-from src.ingestion.schemas import ShaftSpec
+from src.ingestion.load_data import load_database_df, load_filter_options
 
 st.set_page_config(page_title="Compare Shafts", page_icon="⚖️", layout="wide")
 st.title("⚖️ Compare Shafts")
 st.markdown("Select up to 4 shafts for a side-by-side comparison.")
 
+WEIGHT_COLORS = ("#1B5E20", "#4CAF50", "#81C784", "#C8E6C9")
+TORQUE_COLORS = ("#0D47A1", "#1976D2", "#64B5F6", "#BBDEFB")
 
-@st.cache_data
-def get_specs() -> list[dict]:
-    specs = load_database()
-    return [s.model_dump() for s in specs]
+# Cached figures per chart, bounding memory across shaft selections
+CHART_CACHE_ENTRIES = 16
 
 
-specs_data = get_specs()
+@st.cache_data(max_entries=CHART_CACHE_ENTRIES)
+def bar_figure(
+    names: tuple[str, ...],
+    values: tuple[float, ...],
+    colors: tuple[str, ...],
+    title: str,
+    yaxis_title: str,
+) -> go.Figure:
+    """Build a comparison bar chart, cached on the selected shafts and values."""
+    fig = go.Figure(data=[go.Bar(x=list(names), y=list(values), marker_color=list(colors[:len(names)]))])
+    fig.update_layout(title=title, yaxis_title=yaxis_title, height=350)
+    return fig
 
-if not specs_data:
+
+df = load_database_df()
+
+if df.empty:
     st.warning("No shaft data loaded. Run `python -m src.ingestion.load_data` first.")
     st.stop()
 
-# Build display names for selection
-specs = [ShaftSpec(**s) for s in specs_data]
-name_map = {s.display_name: s for s in specs}
-sorted_names = sorted(name_map.keys())
-
 selected = st.multiselect(
     "Select shafts to compare (max 4)",
-    options=sorted_names,
+    options=load_filter_options()["display_names"],
     max_selections=4,
     default=[],
 )
 
 if selected:
-    selected_specs = [name_map[name] for name in selected]
-    comparison = compare_shafts(selected_specs)
+    # The database frame is indexed by display name
+    selected_rows = df.loc[selected]
+    comparison = compare_shafts(selected_rows)
 
     st.dataframe(comparison, use_container_width=True)
 
     # Visual comparison charts
-    if len(selected_specs) >= 2:
-        import plotly.graph_objects as go
-
+    if len(selected_rows) >= 2:
         st.markdown("---")
         st.markdown("### Visual Comparison")
 
-        names = [s.display_name for s in selected_specs]
+        names = tuple(selected)
 
         # Weight comparison
-        weights = [s.weight_grams for s in selected_specs]
-        fig_weight = go.Figure(
-            data=[go.Bar(x=names, y=weights, marker_color=["#1B5E20", "#4CAF50", "#81C784", "#C8E6C9"][:len(names)])]
-        )
-        fig_weight.update_layout(title="Weight (g)", yaxis_title="Grams", height=350)
-        st.plotly_chart(fig_weight, use_container_width=True)
+        weights = tuple(selected_rows["weight_grams"].tolist())
+        fig_weight = bar_figure(names, weights, WEIGHT_COLORS, "Weight (g)", "Grams")
+        st.plotly_chart(fig_weight, use_container_width=True, key="weight_chart")
 
         # Torque comparison
-        torques = [s.torque_degrees if s.torque_degrees else 0 for s in selected_specs]
+        torques = tuple(selected_rows["torque_degrees"].fillna(0).tolist())
         if any(t > 0 for t in torques):
-            fig_torque = go.Figure(
-                data=[go.Bar(x=names, y=torques, marker_color=["#0D47A1", "#1976D2", "#64B5F6", "#BBDEFB"][:len(names)])]
-            )
-            fig_torque.update_layout(title="Torque (°)", yaxis_title="Degrees", height=350)
-            st.plotly_chart(fig_torque, use_container_width=True)
+            fig_torque = bar_figure(names, torques, TORQUE_COLORS, "Torque (°)", "Degrees")
+            st.plotly_chart(fig_torque, use_container_width=True, key="torque_chart")
 else:
     st.info("👆 Select shafts above to begin comparing.")
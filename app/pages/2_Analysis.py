@@ -2,42 +2,53 @@
 
 import sys
 from pathlib import Path
+from typing import Optional
 
+import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.ingestion.load_data import load_database_df
+from src.analysis.compare import downsample
+from src.ingestion.load_data import (
+    database_mtime_ns,
+    load_database_df,
+    load_filter_options,
+)
 
 st.set_page_config(page_title="Shaft Analysis", page_icon="📊", layout="wide")
 st.title("📊 Shaft Analysis")
 
+# Scatter plots above this size are sampled and drawn with WebGL
+SCATTER_MAX_POINTS = 2000
 
-@st.cache_data
-def get_data():
-    return load_database_df()
+# Cached figures per chart, bounding memory across club type / filter choices
+CHART_CACHE_ENTRIES = 16
 
+# Chart builders below are cached on their inputs plus the database version
+# (``db_version``), so widget changes only rebuild the charts they affect.
 
-df = get_data()
 
-if df.empty:
-    st.warning("No shaft data loaded. Run `python -m src.ingestion.load_data` first.")
-    st.stop()
+def club_subset(club_type: str) -> pd.DataFrame:
+    df = load_database_df()
+    return df[df["club_type"] == club_type]
 
-# --- Filter by club type for analysis ---
-club_type = st.selectbox("Club Type", options=sorted(df["club_type"].unique()), index=0)
-subset = df[df["club_type"] == club_type].copy()
 
-st.markdown("---")
+@st.cache_data(max_entries=CHART_CACHE_ENTRIES)
+def weight_torque_scatter(
+    club_type: str, db_version: int
+) -> tuple[Optional[go.Figure], int, int]:
+    """Weight vs. torque scatter, plus the number of points shown and available."""
+    scatter_df = club_subset(club_type).dropna(subset=["torque_degrees"])
+    if scatter_df.empty:
+        return None, 0, 0
 
-# --- Weight vs Torque Scatter ---
-st.markdown("### Weight vs. Torque by Manufacturer")
-scatter_df = subset.dropna(subset=["torque_degrees"])
-if not scatter_df.empty:
+    n_points = len(scatter_df)
+    plot_df = downsample(scatter_df, SCATTER_MAX_POINTS, by="manufacturer")
     fig = px.scatter(
-        scatter_df,
+        plot_df,
         x="weight_grams",
         y="torque_degrees",
         color="manufacturer",
@@ -45,17 +56,131 @@ if not scatter_df.empty:
         hover_data=["flex", "launch", "spin"],
         labels={"weight_grams": "Weight (g)", "torque_degrees": "Torque (°)"},
         height=500,
+        render_mode="webgl" if n_points > SCATTER_MAX_POINTS else "auto",
     )
     fig.update_layout(
         xaxis_title="Weight (g)",
         yaxis_title="Torque (°)",
         legend_title="Manufacturer",
     )
+    return fig, len(plot_df), n_points
+
+
+@st.cache_data(max_entries=CHART_CACHE_ENTRIES)
+def profile_pie(
+    club_type: str, column: str, title: str, colors: tuple[str, ...], db_version: int
+) -> Optional[go.Figure]:
+    counts = club_subset(club_type)[column].value_counts()
+    counts = counts[counts > 0]
+    if counts.empty:
+        return None
+    return px.pie(
+        values=counts.values,
+        names=counts.index,
+        title=title,
+        color_discrete_sequence=list(colors),
+    )
+
+
+@st.cache_data(max_entries=CHART_CACHE_ENTRIES)
+def weight_box(club_type: str, db_version: int) -> go.Figure:
+    fig = px.box(
+        club_subset(club_type),
+        x="manufacturer",
+        y="weight_grams",
+        color="manufacturer",
+        labels={"weight_grams": "Weight (g)", "manufacturer": ""},
+        height=400,
+    )
+    fig.update_layout(showlegend=False)
+    return fig
+
+
+@st.cache_data(max_entries=CHART_CACHE_ENTRIES)
+def models_by_manufacturer(club_type: str, db_version: int) -> dict[str, list[str]]:
+    subset = club_subset(club_type)
+    return {
+        str(mfr): sorted(group["model"].unique())
+        for mfr, group in subset.groupby("manufacturer", observed=True)
+    }
+
+
+@st.cache_data(max_entries=CHART_CACHE_ENTRIES)
+def weight_progression_bar(
+    club_type: str, manufacturer: str, model: str, db_version: int
+) -> Optional[go.Figure]:
+    """Weight by flex for one model, or None if only one flex exists."""
+    subset = club_subset(club_type)
+    prog_df = subset[
+        (subset["manufacturer"] == manufacturer) & (subset["model"] == model)
+    ].sort_values("weight_grams")
+    if len(prog_df) <= 1:
+        return None
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=prog_df["flex"],
+        y=prog_df["weight_grams"],
+        marker_color="#1B5E20",
+        text=prog_df["weight_grams"].apply(lambda x: f"{x:.0f}g"),
+        textposition="outside",
+    ))
+    fig.update_layout(
+        title=f"{manufacturer} {model} — Weight by Flex",
+        yaxis_title="Weight (g)",
+        height=350,
+    )
+    return fig
+
+
+@st.cache_data(max_entries=CHART_CACHE_ENTRIES)
+def msrp_bar(club_type: str, db_version: int) -> Optional[go.Figure]:
+    price_df = (
+        club_subset(club_type)
+        .dropna(subset=["msrp_usd"])
+        .drop_duplicates(subset=["manufacturer", "model"])
+    )
+    if price_df.empty:
+        return None
+
+    avg_prices = price_df.groupby("manufacturer", observed=True)["msrp_usd"].mean().sort_values()
+    fig = go.Figure(
+        data=[go.Bar(
+            x=avg_prices.index,
+            y=avg_prices.values,
+            marker_color="#0D47A1",
+            text=avg_prices.apply(lambda x: f"${x:.0f}"),
+            textposition="outside",
+        )]
+    )
+    fig.update_layout(yaxis_title="Average MSRP ($)", height=350)
+    return fig
+
+
+df = load_database_df()
+
+if df.empty:
+    st.warning("No shaft data loaded. Run `python -m src.ingestion.load_data` first.")
+    st.stop()
+
+db_version = database_mtime_ns()
+
+# --- Filter by club type for analysis ---
+club_type = st.selectbox("Club Type", options=load_filter_options()["club_types"], index=0)
+
+st.markdown("---")
+
+# --- Weight vs Torque Scatter ---
+st.markdown("### Weight vs. Torque by Manufacturer")
+fig, n_shown, n_points = weight_torque_scatter(club_type, db_version)
+if fig is not None:
     st.plotly_chart(fig, use_container_width=True)
     st.caption(
         "💡 Lower-right = heavier and stiffer (tour profile). "
         "Upper-left = lighter and more flexible (game improvement)."
     )
+    if n_shown < n_points:
+        st.caption(f"Showing a sample of {n_shown} of {n_points} shafts.")
 else:
     st.info("No torque data available for this club type.")
 
@@ -66,74 +191,42 @@ st.markdown("### Launch & Spin Profile Distribution")
 col1, col2 = st.columns(2)
 
 with col1:
-    launch_counts = subset["launch"].dropna().value_counts()
-    if not launch_counts.empty:
-        fig_launch = px.pie(
-            values=launch_counts.values,
-            names=launch_counts.index,
-            title="Launch Profiles",
-            color_discrete_sequence=px.colors.sequential.Greens_r,
-        )
+    fig_launch = profile_pie(
+        club_type, "launch", "Launch Profiles", tuple(px.colors.sequential.Greens_r), db_version
+    )
+    if fig_launch is not None:
         st.plotly_chart(fig_launch, use_container_width=True)
 
 with col2:
-    spin_counts = subset["spin"].dropna().value_counts()
-    if not spin_counts.empty:
-        fig_spin = px.pie(
-            values=spin_counts.values,
-            names=spin_counts.index,
-            title="Spin Profiles",
-            color_discrete_sequence=px.colors.sequential.Blues_r,
-        )
+    fig_spin = profile_pie(
+        club_type, "spin", "Spin Profiles", tuple(px.colors.sequential.Blues_r), db_version
+    )
+    if fig_spin is not None:
         st.plotly_chart(fig_spin, use_container_width=True)
 
 st.markdown("---")
 
 # --- Weight Distribution by Manufacturer ---
 st.markdown("### Weight Distribution by Manufacturer")
-fig_box = px.box(
-    subset,
-    x="manufacturer",
-    y="weight_grams",
-    color="manufacturer",
-    labels={"weight_grams": "Weight (g)", "manufacturer": ""},
-    height=400,
-)
-fig_box.update_layout(showlegend=False)
-st.plotly_chart(fig_box, use_container_width=True)
+st.plotly_chart(weight_box(club_type, db_version), use_container_width=True)
 
 st.markdown("---")
 
 # --- Model Weight Progression ---
 st.markdown("### Weight Progression Across Flexes")
+model_options = models_by_manufacturer(club_type, db_version)
 mfr_select = st.selectbox(
     "Manufacturer",
-    options=sorted(subset["manufacturer"].unique()),
+    options=list(model_options),
     key="mfr_prog",
 )
 
-models_available = sorted(subset[subset["manufacturer"] == mfr_select]["model"].unique())
+models_available = model_options.get(mfr_select, [])
 model_select = st.selectbox("Model", options=models_available, key="model_prog")
 
 if mfr_select and model_select:
-    prog_df = subset[
-        (subset["manufacturer"] == mfr_select) & (subset["model"] == model_select)
-    ].sort_values("weight_grams")
-
-    if len(prog_df) > 1:
-        fig_prog = go.Figure()
-        fig_prog.add_trace(go.Bar(
-            x=prog_df["flex"],
-            y=prog_df["weight_grams"],
-            marker_color="#1B5E20",
-            text=prog_df["weight_grams"].apply(lambda x: f"{x:.0f}g"),
-            textposition="outside",
-        ))
-        fig_prog.update_layout(
-            title=f"{mfr_select} {model_select} — Weight by Flex",
-            yaxis_title="Weight (g)",
-            height=350,
-        )
+    fig_prog = weight_progression_bar(club_type, mfr_select, model_select, db_version)
+    if fig_prog is not None:
         st.plotly_chart(fig_prog, use_container_width=True)
     else:
         st.info("Only one flex available for this model.")
@@ -141,17 +234,6 @@ if mfr_select and model_select:
 # --- Price Comparison ---
 st.markdown("---")
 st.markdown("### MSRP by Manufacturer")
-price_df = subset.dropna(subset=["msrp_usd"]).drop_duplicates(subset=["manufacturer", "model"])
-if not price_df.empty:
-    avg_prices = price_df.groupby("manufacturer")["msrp_usd"].mean().sort_values()
-    fig_price = go.Figure(
-        data=[go.Bar(
-            x=avg_prices.index,
-            y=avg_prices.values,
-            marker_color="#0D47A1",
-            text=avg_prices.apply(lambda x: f"${x:.0f}"),
-            textposition="outside",
-        )]
-    )
-    fig_price.update_layout(yaxis_title="Average MSRP ($)", height=350)
+fig_price = msrp_bar(club_type, db_version)
+if fig_price is not None:
     st.plotly_chart(fig_price, use_container_width=True)
@@ -1,8 +1,9 @@
-import subprocess
 import sys
 from pathlib import Path
 
-# Run data loader before app starts if processed data doesn't exist
-db_file = Path(__file__).parent.parent / "data" / "processed" / "shaft_database.json"
-if not db_file.exists():
-    subprocess.run([sys.executable, "-m", "src.ingestion.load_data"], cwd=str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ingestion.load_data import ensure_database
+
+# Build the processed database before the app starts if it doesn't exist
+ensure_database()
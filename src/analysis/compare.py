@@ -2,46 +2,60 @@
 
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-from ..ingestion.schemas import FLEX_ORDER, Flex, ShaftSpec
+from ..ingestion.normalizer import ENUM_DTYPES
 
 
-def compare_shafts(specs: list[ShaftSpec]) -> pd.DataFrame:
+def _or_na(values: pd.Series) -> pd.Series:
+    return values.astype(object).where(values.notna() & (values != 0), "N/A")
+
+
+def _title(values: pd.Series) -> pd.Series:
+    return values.astype(str).str.title()
+
+
+def _price(values: pd.Series) -> pd.Series:
+    return _or_na(values).map(lambda v: v if v == "N/A" else f"${v:.0f}")
+
+
+# (row label, column formatter) pairs for the side-by-side comparison table
+COMPARE_FIELDS = [
+    ("Manufacturer", lambda df: df["manufacturer"]),
+    ("Model", lambda df: df["model"]),
+    ("Club Type", lambda df: _title(df["club_type"])),
+    ("Flex", lambda df: df["flex"]),
+    ("Weight (g)", lambda df: df["weight_grams"]),
+    ("Length (in)", lambda df: _or_na(df["length_inches"])),
+    ("Torque (°)", lambda df: _or_na(df["torque_degrees"])),
+    ("Launch", lambda df: _or_na(df["launch"])),
+    ("Spin", lambda df: _or_na(df["spin"])),
+    ("Kickpoint", lambda df: _or_na(df["kickpoint"])),
+    ("Tip Stiffness", lambda df: _or_na(df["tip_stiff"])),
+    ("Tip (in)", lambda df: _or_na(df["tip_diameter_inches"])),
+    ("Butt (in)", lambda df: _or_na(df["butt_diameter_inches"])),
+    ("Material", lambda df: _title(df["material"])),
+    ("MSRP", lambda df: _price(df["msrp_usd"])),
+]
+
+
+def compare_shafts(shafts: pd.DataFrame) -> pd.DataFrame:
     """
-    Create a side-by-side comparison DataFrame for a list of shafts.
+    Create a side-by-side comparison DataFrame for a set of shafts.
 
-    Returns a transposed DataFrame where columns are shaft names and rows are spec fields.
+    Takes rows of the shaft database DataFrame indexed by display name and
+    returns a DataFrame where columns are shaft names and rows are spec fields.
     """
-    if not specs:
+    if shafts.empty:
         return pd.DataFrame()
 
-    rows = []
-    for spec in specs:
-        rows.append({
-            "Shaft": spec.display_name,
-            "Manufacturer": spec.manufacturer,
-            "Model": spec.model,
-            "Club Type": spec.club_type.value.title(),
-            "Flex": spec.flex.value,
-            "Weight (g)": spec.weight_grams,
-            "Length (in)": spec.length_inches or "N/A",
-            "Torque (°)": spec.torque_degrees or "N/A",
-            "Launch": spec.launch.value if spec.launch else "N/A",
-            "Spin": spec.spin.value if spec.spin else "N/A",
-            "Kickpoint": spec.kickpoint.value if spec.kickpoint else "N/A",
-            "Tip Stiffness": spec.tip_stiff.value if spec.tip_stiff else "N/A",
-            "Tip (in)": spec.tip_diameter_inches or "N/A",
-            "Butt (in)": spec.butt_diameter_inches or "N/A",
-            "Material": spec.material.title(),
-            "MSRP": f"${spec.msrp_usd:.0f}" if spec.msrp_usd else "N/A",
-        })
-
-    df = pd.DataFrame(rows).set_index("Shaft").T
-    return df
+    data = {label: fmt(shafts).tolist() for label, fmt in COMPARE_FIELDS}
+    columns = pd.Index(shafts.index, name="Shaft")
+    return pd.DataFrame.from_dict(data, orient="index", columns=columns)
 
 
-def filter_shafts(
+def filter_mask(
     df: pd.DataFrame,
     manufacturers: Optional[list[str]] = None,
     club_types: Optional[list[str]] = None,
@@ -53,32 +67,79 @@ def filter_shafts(
     launch_profiles: Optional[list[str]] = None,
     spin_profiles: Optional[list[str]] = None,
     price_max: Optional[float] = None,
-) -> pd.DataFrame:
-    """Apply filters to a shaft database DataFrame."""
-    filtered = df.copy()
+) -> Optional[np.ndarray]:
+    """
+    Build a combined boolean row mask for the given filters.
+
+    Returns None when no filter is active.
+    """
+    masks: list[np.ndarray] = []
 
     if manufacturers:
-        filtered = filtered[filtered["manufacturer"].isin(manufacturers)]
+        masks.append(df["manufacturer"].isin(manufacturers).to_numpy())
     if club_types:
-        filtered = filtered[filtered["club_type"].isin(club_types)]
+        masks.append(df["club_type"].isin(club_types).to_numpy())
     if flexes:
-        filtered = filtered[filtered["flex"].isin(flexes)]
+        masks.append(df["flex"].isin(flexes).to_numpy())
     if weight_min is not None:
-        filtered = filtered[filtered["weight_grams"] >= weight_min]
+        masks.append(df["weight_grams"].to_numpy() >= weight_min)
     if weight_max is not None:
-        filtered = filtered[filtered["weight_grams"] <= weight_max]
-    if torque_min is not None:
-        filtered = filtered[filtered["torque_degrees"].notna() & (filtered["torque_degrees"] >= torque_min)]
-    if torque_max is not None:
-        filtered = filtered[filtered["torque_degrees"].notna() & (filtered["torque_degrees"] <= torque_max)]
+        masks.append(df["weight_grams"].to_numpy() <= weight_max)
+    if torque_min is not None or torque_max is not None:
+        torque = df["torque_degrees"].to_numpy(dtype=float, na_value=np.nan)
+        masks.append(~np.isnan(torque))
+        if torque_min is not None:
+            masks.append(torque >= torque_min)
+        if torque_max is not None:
+            masks.append(torque <= torque_max)
     if launch_profiles:
-        filtered = filtered[filtered["launch"].isin(launch_profiles)]
+        masks.append(df["launch"].isin(launch_profiles).to_numpy())
     if spin_profiles:
-        filtered = filtered[filtered["spin"].isin(spin_profiles)]
+        masks.append(df["spin"].isin(spin_profiles).to_numpy())
     if price_max is not None:
-        filtered = filtered[filtered["msrp_usd"].notna() & (filtered["msrp_usd"] <= price_max)]
+        price = df["msrp_usd"].to_numpy(dtype=float, na_value=np.nan)
+        masks.append(~np.isnan(price) & (price <= price_max))
 
-    return filtered
+    if not masks:
+        return None
+    return np.logical_and.reduce(masks)
+
+
+def filter_shafts(
+    df: pd.DataFrame,
+    manufacturers: Optional[list[str]] = None,
+    club_types: Optional[list[str]] = None,
+    flexes: Optional[list[str]] = None,
+    weight_min: Optional[float] = None,
+    weight_max: Optional[float] = None,
+    torque_min: Optional[float] = None,
+    torque_max: Optional[float] = None,
+    launch_profiles: Optional[list[str]] = None,
+    spin_profiles: Optional[list[str]] = None,
+    price_max: Optional[float] = None,
+) -> pd.DataFrame:
+    """
+    Apply filters to a shaft database DataFrame.
+
+    Returns ``df`` itself when no filter is active, otherwise a boolean-indexed
+    slice. Either way the result should be treated as read-only.
+    """
+    mask = filter_mask(
+        df,
+        manufacturers=manufacturers,
+        club_types=club_types,
+        flexes=flexes,
+        weight_min=weight_min,
+        weight_max=weight_max,
+        torque_min=torque_min,
+        torque_max=torque_max,
+        launch_profiles=launch_profiles,
+        spin_profiles=spin_profiles,
+        price_max=price_max,
+    )
+    if mask is None:
+        return df
+    return df.loc[mask]
 
 
 def weight_progression(df: pd.DataFrame, manufacturer: str, model: str) -> pd.DataFrame:
@@ -88,5 +149,42 @@ def weight_progression(df: pd.DataFrame, manufacturer: str, model: str) -> pd.Da
     Useful for visualizing how weight increases through a product line.
     """
     subset = df[(df["manufacturer"] == manufacturer) & (df["model"] == model)].copy()
-    subset["flex_order"] = subset["flex"].map(lambda f: FLEX_ORDER.get(Flex(f), 3))
+    # Codes of the ordered flex dtype follow enum order, matching FLEX_ORDER
+    subset["flex_order"] = subset["flex"].astype(ENUM_DTYPES["flex"]).cat.codes
     return subset.sort_values("flex_order")
+
+
+def downsample(df: pd.DataFrame, max_points: int, by: str) -> pd.DataFrame:
+    """
+    Randomly sample a frame down to at most ``max_points`` rows for plotting.
+
+    Sampling is stratified on ``by``: each group keeps roughly its share of
+    points and at least one (as long as there are no more groups than
+    ``max_points``). The sample is deterministic and keeps the frame's row order.
+    """
+    if len(df) <= max_points:
+        return df
+
+    codes = df.groupby(by, observed=True).ngroup().to_numpy()
+    sizes = np.bincount(codes[codes >= 0])
+    quotas = np.maximum(1, np.round(sizes * max_points / len(df))).astype(int)
+
+    # Rounding up small groups can overshoot; take the excess from the largest quotas
+    excess = quotas.sum() - max_points
+    for group in np.argsort(-quotas, kind="stable"):
+        if excess <= 0:
+            break
+        cut = min(excess, quotas[group] - 1)
+        quotas[group] -= cut
+        excess -= cut
+
+    # First ``quota`` rows of each group in a fixed random permutation
+    rng = np.random.default_rng(0)
+    perm = rng.permutation(len(df))
+    perm_codes = codes[perm]
+    rank = pd.Series(perm_codes).groupby(perm_codes).cumcount().to_numpy()
+    selected = np.sort(perm[(perm_codes >= 0) & (rank < quotas[perm_codes])])
+    if len(selected) > max_points:
+        # More groups than points: some groups cannot be shown
+        selected = np.sort(rng.choice(selected, max_points, replace=False))
+    return df.iloc[selected]
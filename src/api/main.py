@@ -1,17 +1,24 @@
 """Golf Shaft Analytics REST API."""
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from fastapi import FastAPI, Query
+import numpy as np
+import orjson
+from fastapi import FastAPI, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.analysis.compare import filter_shafts
-from src.ingestion.load_data import load_database, load_database_df
-from src.ingestion.schemas import ShaftSpec
+from src.analysis.compare import filter_mask
+from src.ingestion.load_data import (
+    SEARCH_COLUMN,
+    database_mtime_ns,
+    load_database_df,
+    load_filter_options,
+)
 
 app = FastAPI(
     title="Golf Shaft Analytics API",
@@ -27,6 +34,51 @@ app.add_middleware(
 )
 
 
+def _public_columns(df) -> list[str]:
+    """Columns exposed by the API (internal helper columns are underscore-prefixed)."""
+    return [c for c in df.columns if not c.startswith("_")]
+
+
+# Response caches below are keyed on the database mtime, so they are rebuilt
+# automatically when the database file is regenerated.
+
+
+@lru_cache(maxsize=1)
+def _shaft_rows_json(mtime_ns: int) -> list[bytes]:
+    """One pre-serialized JSON object per database row, in frame order."""
+    df = load_database_df()
+    if df.empty:
+        return []
+    records = df[_public_columns(df)].to_dict(orient="records")
+    return [orjson.dumps(record) for record in records]
+
+
+def _counts(column) -> dict:
+    """Value counts of a categorical column, without its unused categories."""
+    counts = column.value_counts()
+    return counts[counts > 0].to_dict()
+
+
+@lru_cache(maxsize=1)
+def _stats(mtime_ns: int) -> dict:
+    df = load_database_df()
+    if df.empty:
+        return {"total_shafts": 0}
+
+    return {
+        "total_shafts": len(df),
+        "manufacturers": int(df["manufacturer"].nunique()),
+        "models": int(df["model"].nunique()),
+        "club_types": _counts(df["club_type"]),
+        "flex_distribution": _counts(df["flex"]),
+        "weight_range": {
+            "min": float(df["weight_grams"].min()),
+            "max": float(df["weight_grams"].max()),
+            "mean": round(float(df["weight_grams"].mean()), 1),
+        },
+    }
+
+
 @app.get("/")
 def root():
     return {
@@ -51,7 +103,8 @@ def list_shafts(
     if df.empty:
         return []
 
-    filtered = filter_shafts(
+    rows = _shaft_rows_json(database_mtime_ns())
+    mask = filter_mask(
         df,
         manufacturers=[manufacturer] if manufacturer else None,
         club_types=[club_type] if club_type else None,
@@ -59,9 +112,12 @@ def list_shafts(
         weight_min=weight_min,
         weight_max=weight_max,
     )
+    if mask is None:
+        page = rows[offset : offset + limit]
+    else:
+        page = [rows[i] for i in np.flatnonzero(mask)[offset : offset + limit]]
 
-    result = filtered.iloc[offset : offset + limit]
-    return result.to_dict(orient="records")
+    return Response(b"[" + b",".join(page) + b"]", media_type="application/json")
 
 
 @app.get("/shafts/search", response_model=list[dict])
@@ -74,38 +130,19 @@ def search_shafts(
         return []
 
     query = q.lower()
-    mask = (
-        df["manufacturer"].str.lower().str.contains(query, na=False)
-        | df["model"].str.lower().str.contains(query, na=False)
+    mask = df[SEARCH_COLUMN].str.contains(query, regex=False).to_numpy(
+        dtype=bool, na_value=False
     )
-    return df[mask].to_dict(orient="records")
+    return df.loc[mask, _public_columns(df)].to_dict(orient="records")
 
 
 @app.get("/manufacturers")
 def list_manufacturers():
     """List all manufacturers in the database."""
-    df = load_database_df()
-    if df.empty:
-        return []
-    return sorted(df["manufacturer"].unique().tolist())
+    return load_filter_options()["manufacturers"]
 
 
 @app.get("/stats")
 def database_stats():
     """Get database statistics."""
-    df = load_database_df()
-    if df.empty:
-        return {"total_shafts": 0}
-
-    return {
-        "total_shafts": len(df),
-        "manufacturers": int(df["manufacturer"].nunique()),
-        "models": int(df["model"].nunique()),
-        "club_types": df["club_type"].value_counts().to_dict(),
-        "flex_distribution": df["flex"].value_counts().to_dict(),
-        "weight_range": {
-            "min": float(df["weight_grams"].min()),
-            "max": float(df["weight_grams"].max()),
-            "mean": round(float(df["weight_grams"].mean()), 1),
-        },
-    }
+    return _stats(database_mtime_ns())
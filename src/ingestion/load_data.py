@@ -1,41 +1,70 @@
 """Load and normalize shaft data from raw CSV files into the processed database."""
 
-import json
+import functools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Union
 
+import orjson
 import pandas as pd
+import pyarrow.csv as pacsv
 
-from .normalizer import normalize_dataframe
-from .schemas import ClubType, ShaftSpec
+from .normalizer import ENUM_DTYPES, normalize_dataframe, standardize_columns
+from .schemas import ClubType, ShaftSpec, ShaftSpecRaw
 
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 RAW_DIR = DATA_DIR / "raw"
 PROCESSED_DIR = DATA_DIR / "processed"
 DB_FILE = PROCESSED_DIR / "shaft_database.json"
 
+# Low-cardinality columns stored as pandas categoricals in the loaded DataFrame
+# (enum fields use the shared ENUM_DTYPES, so flex etc. sort in enum order)
+CATEGORICAL_COLUMNS = [
+    "manufacturer",
+    "model",
+    "club_type",
+    "flex",
+    "launch",
+    "spin",
+    "kickpoint",
+    "tip_stiff",
+    "material",
+]
+
+# Categoricals with alphabetically ordered categories, so sorts use the codes
+ORDERED_CATEGORICAL_COLUMNS = ["manufacturer", "model"]
+
+# Lowercased "manufacturer model" text used for free-text search
+SEARCH_COLUMN = "_search"
+
 
 def load_raw_csv(filepath: Path) -> pd.DataFrame:
     """Load a raw CSV file with shaft specifications."""
-    df = pd.read_csv(filepath)
-    # Standardize column names
-    df.columns = df.columns.str.strip().str.lower().str.replace(" ", "_")
-    return df
+    # pyarrow's reader parses blocks in parallel; empty fields become nulls like read_csv
+    table = pacsv.read_csv(
+        filepath, convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+    )
+    return standardize_columns(table.to_pandas())
 
 
-def detect_club_type(df: pd.DataFrame) -> dict[str, list[int]]:
+def _club_type_key(df: pd.DataFrame) -> pd.Series:
+    """Normalized club type per row, defaulting to 'woods'."""
+    if "club_type" in df.columns:
+        return df["club_type"].str.strip().str.lower().fillna("woods")
+    return pd.Series("woods", index=df.index)
+
+
+def detect_club_type(df: pd.DataFrame) -> dict[str, pd.Index]:
     """
-    Group rows by club type.
+    Group row labels by club type.
 
     If the dataframe has a 'club_type' column, use it.
     Otherwise, default to 'woods'.
     """
-    if "club_type" in df.columns:
-        groups = {}
-        for idx, row in df.iterrows():
-            ct = row["club_type"].strip().lower()
-            groups.setdefault(ct, []).append(idx)
-        return groups
-    return {"woods": list(df.index)}
+    key = _club_type_key(df)
+    return dict(key.groupby(key, sort=False).groups)
 
 
 CLUB_TYPE_MAP = {
@@ -48,79 +77,207 @@ CLUB_TYPE_MAP = {
 }
 
 
-def load_and_normalize(filepath: Path) -> list[ShaftSpec]:
-    """Load a raw CSV and normalize all rows into ShaftSpec objects."""
+def load_and_normalize(
+    filepath: Path, raw: bool = False
+) -> Union[list[ShaftSpec], list[ShaftSpecRaw]]:
+    """
+    Load a raw CSV and normalize all rows into ShaftSpec objects.
+
+    With ``raw=True`` the rows are slotted ShaftSpecRaw objects instead.
+    """
     df = load_raw_csv(filepath)
-    all_specs: list[ShaftSpec] = []
-
-    # Group by manufacturer and club type
-    if "manufacturer" in df.columns:
-        for manufacturer, mfr_group in df.groupby("manufacturer"):
-            type_groups = detect_club_type(mfr_group)
-            for type_name, indices in type_groups.items():
-                club_type = CLUB_TYPE_MAP.get(type_name, ClubType.WOODS)
-                subset = mfr_group.loc[indices]
-                specs = normalize_dataframe(subset, str(manufacturer), club_type)
-                all_specs.extend(specs)
-    else:
+    if "manufacturer" not in df.columns:
         raise ValueError("CSV must have a 'manufacturer' column")
 
+    # Group by manufacturer and club type in a single pass. Keep the database order:
+    # manufacturers alphabetical, club types in order of appearance within each
+    # (sorted() is stable), which the paginated /shafts endpoint exposes.
+    all_specs = []
+    groups = df.groupby([df["manufacturer"], _club_type_key(df)], sort=False)
+    for (manufacturer, type_name), subset in sorted(groups, key=lambda group: group[0][0]):
+        club_type = CLUB_TYPE_MAP.get(type_name, ClubType.WOODS)
+        specs = normalize_dataframe(subset, str(manufacturer), club_type, raw=raw)
+        all_specs.extend(specs)
+
     return all_specs
 
 
-def save_database(specs: list[ShaftSpec], filepath: Path = DB_FILE) -> None:
-    """Save normalized specs to JSON database."""
+def _categorize(df: pd.DataFrame) -> pd.DataFrame:
+    """Apply the categorical dtypes to a database frame."""
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = df[col].astype(ENUM_DTYPES.get(col, "category"))
+    for col in ORDERED_CATEGORICAL_COLUMNS:
+        df[col] = df[col].cat.as_ordered()
+    return df
+
+
+def _records_to_frame(data: list[dict]) -> pd.DataFrame:
+    """Build a DataFrame from database records with categorical columns."""
+    return _categorize(pd.DataFrame.from_records(data, columns=list(ShaftSpec.model_fields)))
+
+
+def save_database(
+    specs: Union[list[ShaftSpec], list[ShaftSpecRaw]], filepath: Path = DB_FILE
+) -> None:
+    """
+    Save normalized specs (ShaftSpec or ShaftSpecRaw) to the JSON database.
+
+    A columnar Parquet copy is written alongside (same name, ``.parquet``
+    suffix) for fast DataFrame loads.
+    """
     filepath.parent.mkdir(parents=True, exist_ok=True)
-    data = [spec.model_dump(mode="json") for spec in specs]
-    filepath.write_text(json.dumps(data, indent=2))
+    data = [
+        spec.to_dict() if isinstance(spec, ShaftSpecRaw) else spec.model_dump(mode="json")
+        for spec in specs
+    ]
+    filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    _records_to_frame(data).to_parquet(
+        filepath.with_suffix(".parquet"), compression="zstd", index=False
+    )
     print(f"💾 Saved {len(data)} shafts to {filepath}")
 
 
-def load_database(filepath: Path = DB_FILE) -> list[ShaftSpec]:
-    """Load the processed shaft database."""
+def load_database_raw(filepath: Path = DB_FILE) -> list[dict]:
+    """Load the processed shaft database as plain dicts, without validation."""
     if not filepath.exists():
         print("⚠️  No processed database found. Run load_data first.")
         return []
-    data = json.loads(filepath.read_text())
-    return [ShaftSpec(**item) for item in data]
+    return orjson.loads(filepath.read_bytes())
+
+
+def load_database(filepath: Path = DB_FILE) -> list[ShaftSpec]:
+    """Load the processed shaft database."""
+    return [ShaftSpec(**item) for item in load_database_raw(filepath)]
+
+
+def _mtime_ns(filepath: Path) -> int:
+    return filepath.stat().st_mtime_ns if filepath.exists() else 0
+
+
+def database_mtime_ns(filepath: Path = DB_FILE) -> int:
+    """
+    Latest modification time in ns of the database files (0 if missing).
+
+    Covers both the JSON database and its Parquet copy, for use as a cache key.
+    """
+    return max(_mtime_ns(filepath), _mtime_ns(filepath.with_suffix(".parquet")))
+
+
+def _display_names(df: pd.DataFrame) -> pd.Series:
+    """Vectorized equivalent of ShaftSpec.display_name."""
+    gen = df["generation"].fillna("").astype(str)
+    gen = (" " + gen).where(gen != "", "")
+    return (
+        df["manufacturer"].astype(str)
+        + " "
+        + df["model"].astype(str)
+        + gen
+        + " "
+        + df["flex"].astype(str)
+    )
 
 
 def load_database_df(filepath: Path = DB_FILE) -> pd.DataFrame:
-    """Load the processed shaft database as a pandas DataFrame."""
-    specs = load_database(filepath)
-    if not specs:
+    """
+    Load the processed shaft database as a pandas DataFrame.
+
+    Rows are indexed by display name (also kept as a ``display_name`` column).
+    The frame is cached per file modification time and shared between callers,
+    so treat it as read-only — copy before mutating.
+    """
+    if not filepath.exists():
+        print("⚠️  No processed database found. Run load_data first.")
+        return pd.DataFrame()
+    return _load_database_df_cached(filepath, database_mtime_ns(filepath))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_database_df_cached(filepath: Path, mtime_ns: int) -> pd.DataFrame:
+    """Build the categorical-typed database DataFrame (cached on path + mtime)."""
+    # Prefer the Parquet copy unless the JSON database was written after it
+    parquet_file = filepath.with_suffix(".parquet")
+    if _mtime_ns(parquet_file) >= _mtime_ns(filepath):
+        # Re-apply the dtypes: Parquet keeps only the categories that occur
+        df = _categorize(pd.read_parquet(parquet_file))
+    else:
+        df = _records_to_frame(load_database_raw(filepath))
+    if df.empty:
         return pd.DataFrame()
-    return pd.DataFrame([spec.model_dump() for spec in specs])
+    df[SEARCH_COLUMN] = (
+        (df["manufacturer"].astype(str) + " " + df["model"].astype(str))
+        .str.lower()
+        .astype("string[pyarrow]")
+    )
+    df["display_name"] = _display_names(df)
+    return df.set_index("display_name", drop=False)
+
+
+def load_filter_options(filepath: Path = DB_FILE) -> dict[str, list[str]]:
+    """
+    Sorted selector options for the database, cached per file modification time.
+
+    Keys are ``manufacturers``, ``club_types`` and ``display_names``. The lists
+    are shared between callers, so treat them as read-only.
+    """
+    return _load_filter_options_cached(filepath, database_mtime_ns(filepath))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_filter_options_cached(filepath: Path, mtime_ns: int) -> dict[str, list[str]]:
+    df = load_database_df(filepath)
+    if df.empty:
+        return {"manufacturers": [], "club_types": [], "display_names": []}
+    return {
+        "manufacturers": sorted(df["manufacturer"].cat.categories),
+        "club_types": sorted(df["club_type"].cat.remove_unused_categories().cat.categories),
+        "display_names": sorted(df.index),
+    }
+
+
+def _process_csv(csv_file: Path) -> list[ShaftSpecRaw]:
+    print(f"\n📂 Processing {csv_file.name}...")
+    return load_and_normalize(csv_file, raw=True)
 
 
 def main():
     """Main entry point — load all raw CSVs and build the database."""
-    all_specs: list[ShaftSpec] = []
-
     csv_files = list(RAW_DIR.glob("*.csv"))
     if not csv_files:
         print("❌ No CSV files found in data/raw/")
         return
 
-    for csv_file in csv_files:
-        print(f"\n📂 Processing {csv_file.name}...")
-        specs = load_and_normalize(csv_file)
-        all_specs.extend(specs)
+    # Deduplicate by display_name as results arrive (first occurrence wins)
+    unique_specs: dict[str, ShaftSpecRaw] = {}
+    total = 0
 
-    print(f"\n{'='*50}")
-    print(f"Total shafts normalized: {len(all_specs)}")
+    def collect(specs: list[ShaftSpecRaw]) -> None:
+        nonlocal total
+        total += len(specs)
+        for spec in specs:
+            unique_specs.setdefault(spec.display_name, spec)
 
-    # Deduplicate by display_name
-    seen = set()
-    unique_specs = []
-    for spec in all_specs:
-        key = spec.display_name
-        if key not in seen:
-            seen.add(key)
-            unique_specs.append(spec)
+    # Files are independent, so normalize them in parallel when there are several.
+    # Spawn rather than fork: ensure_database() runs this inside the multithreaded
+    # Streamlit server, where forked workers can deadlock on inherited locks.
+    if len(csv_files) > 1:
+        workers = min(len(csv_files), os.cpu_count() or 1)
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            for specs in executor.map(_process_csv, csv_files):
+                collect(specs)
+    else:
+        collect(_process_csv(csv_files[0]))
 
+    print(f"\n{'='*50}")
+    print(f"Total shafts normalized: {total}")
     print(f"Unique shafts after dedup: {len(unique_specs)}")
-    save_database(unique_specs)
+    save_database(list(unique_specs.values()))
+
+
+def ensure_database() -> None:
+    """Build the processed database in-process if it does not exist yet."""
+    if not DB_FILE.exists():
+        main()
 
 
 if __name__ == "__main__":
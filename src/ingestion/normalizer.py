@@ -1,8 +1,14 @@
 """Normalize raw shaft data from various manufacturer formats into the standard schema."""
 
-import re
-from typing import Optional
-
+import functools
+import logging
+import string
+import sys
+from enum import Enum
+from typing import Callable, Optional, TypeVar, Union
+
+import numpy as np
+import orjson
 import pandas as pd
 
 from .schemas import (
@@ -11,10 +17,15 @@ from .schemas import (
     Kickpoint,
     LaunchProfile,
     ShaftSpec,
+    ShaftSpecRaw,
     SpinProfile,
     TipStiffness,
 )
 
+logger = logging.getLogger(__name__)
+
+E = TypeVar("E", bound=Enum)
+
 # --- Flex normalization mappings ---
 FLEX_MAP: dict[str, Flex] = {
     "l": Flex.LADIES,
@@ -34,6 +45,13 @@ FLEX_MAP: dict[str, Flex] = {
     "xxx": Flex.TX,
 }
 
+# Lowercases ASCII letters and drops spaces in one pass (flex codes are ASCII)
+_FLEX_TRANSLATION = str.maketrans(string.ascii_uppercase, string.ascii_lowercase, " ")
+
+# Flex suffixes of weight+flex combos like "6.0s" or "60tx", longest first
+_FLEX_SUFFIXES = ("tx", "xs", "s", "r", "x", "a", "l")
+_FLEX_SUFFIX_PATTERN = r"[0-9.](" + "|".join(_FLEX_SUFFIXES) + r")$"
+
 LAUNCH_MAP: dict[str, LaunchProfile] = {
     "low": LaunchProfile.LOW,
     "low-mid": LaunchProfile.LOW_MID,
@@ -77,60 +95,150 @@ TIP_STIFF_MAP: dict[str, TipStiffness] = {
 }
 
 
+# Raw column names for each ShaftSpec field, in lookup order
+COLUMN_ALIASES: dict[str, tuple[str, ...]] = {
+    "model": ("model", "shaft", "name", "product"),
+    "generation": ("generation", "gen", "version"),
+    "flex": ("flex", "stiffness", "Flex"),
+    "weight_grams": ("weight", "weight_grams", "wt"),
+    "length_inches": ("length", "length_inches", "raw_length"),
+    "torque_degrees": ("torque", "torque_degrees"),
+    "launch": ("launch", "launch_profile"),
+    "spin": ("spin", "spin_profile"),
+    "kickpoint": ("kickpoint", "kick_point", "bend_point"),
+    "tip_stiff": ("tip_stiff", "tip_stiffness", "tip"),
+    "butt_diameter_inches": ("butt_diameter", "butt"),
+    "tip_diameter_inches": ("tip_diameter", "tip_dia"),
+    "material": ("material",),
+    "msrp_usd": ("msrp", "msrp_usd", "price"),
+}
+
+# Enum fields stored as categoricals of their values in DataFrames
+ENUM_FIELDS: dict[str, type[Enum]] = {
+    "club_type": ClubType,
+    "flex": Flex,
+    "launch": LaunchProfile,
+    "spin": SpinProfile,
+    "kickpoint": Kickpoint,
+    "tip_stiff": TipStiffness,
+}
+
+# Categorical dtype per enum field: every enum value, ordered in enum definition
+# order (e.g. Ladies < TX) except club_type, which has no natural order
+ENUM_DTYPES: dict[str, pd.CategoricalDtype] = {
+    name: pd.CategoricalDtype([member.value for member in enum], ordered=enum is not ClubType)
+    for name, enum in ENUM_FIELDS.items()
+}
+
+# ShaftSpec field constraints (Gt, Lt, MinLen, ...), read from the schema so the
+# bulk path's checks before model_construct cannot drift from validation
+FIELD_CONSTRAINTS: dict[str, list] = {
+    name: list(info.metadata)
+    for name, info in ShaftSpec.model_fields.items()
+    if info.metadata
+}
+
+# Fields read as text (stripped strings)
+TEXT_FIELDS = (
+    "model",
+    "generation",
+    "flex",
+    "launch",
+    "spin",
+    "kickpoint",
+    "tip_stiff",
+    "material",
+)
+
+# Fields coerced to float (unparseable values become missing)
+NUMERIC_FIELDS = (
+    "weight_grams",
+    "length_inches",
+    "torque_degrees",
+    "butt_diameter_inches",
+    "tip_diameter_inches",
+    "msrp_usd",
+)
+
+
+# Spec sheets repeat a handful of raw strings, so the string normalizers are memoized
+@functools.lru_cache(maxsize=256)
 def normalize_flex(raw: str) -> Flex:
     """Convert various flex representations to standard Flex enum."""
-    cleaned = raw.strip().lower().replace(" ", "")
+    cleaned = raw.translate(_FLEX_TRANSLATION).strip()
     if cleaned in FLEX_MAP:
         return FLEX_MAP[cleaned]
     # Try to extract flex from weight+flex combos like "6.0S" or "60X"
-    match = re.search(r"[0-9.]+(s|r|x|tx|xs|a|l)$", cleaned)
-    if match:
-        return FLEX_MAP.get(match.group(1), Flex.STIFF)
+    for suffix in _FLEX_SUFFIXES:
+        if cleaned.endswith(suffix):
+            head = cleaned[: -len(suffix)]
+            if head and head[-1] in "0123456789.":
+                return FLEX_MAP[suffix]
     raise ValueError(f"Cannot normalize flex: '{raw}'")
 
 
-def normalize_launch(raw: Optional[str]) -> Optional[LaunchProfile]:
-    """Convert launch description to standard enum."""
-    if not raw or pd.isna(raw):
-        return None
-    cleaned = raw.strip().lower()
-    return LAUNCH_MAP.get(cleaned)
+def _is_empty(raw) -> bool:
+    """True for None, empty strings and NaN."""
+    return not raw or pd.isna(raw)
 
 
-def normalize_spin(raw: Optional[str]) -> Optional[SpinProfile]:
-    """Convert spin description to standard enum."""
-    if not raw or pd.isna(raw):
-        return None
-    cleaned = raw.strip().lower()
-    return SPIN_MAP.get(cleaned)
+def _make_normalizer(
+    mapping: dict[str, E], name: str, doc: str
+) -> Callable[[Optional[str]], Optional[E]]:
+    """Build a normalizer that maps a stripped, lowercased description via ``mapping``."""
 
+    def normalize(raw: Optional[str]) -> Optional[E]:
+        if _is_empty(raw):
+            return None
+        return mapping.get(raw.strip().lower())
 
-def normalize_kickpoint(raw: Optional[str]) -> Optional[Kickpoint]:
-    """Convert kickpoint description to standard enum."""
-    if not raw or pd.isna(raw):
-        return None
-    cleaned = raw.strip().lower()
-    return KICKPOINT_MAP.get(cleaned)
+    normalize.__name__ = normalize.__qualname__ = name
+    normalize.__doc__ = doc
+    return functools.lru_cache(maxsize=256)(normalize)
 
 
-def normalize_tip_stiffness(raw: Optional[str]) -> Optional[TipStiffness]:
-    """Convert tip stiffness description to standard enum."""
-    if not raw or pd.isna(raw):
-        return None
-    cleaned = raw.strip().lower()
-    return TIP_STIFF_MAP.get(cleaned)
+normalize_launch = _make_normalizer(
+    LAUNCH_MAP, "normalize_launch", "Convert launch description to standard enum."
+)
+normalize_spin = _make_normalizer(
+    SPIN_MAP, "normalize_spin", "Convert spin description to standard enum."
+)
+normalize_kickpoint = _make_normalizer(
+    KICKPOINT_MAP, "normalize_kickpoint", "Convert kickpoint description to standard enum."
+)
+normalize_tip_stiffness = _make_normalizer(
+    TIP_STIFF_MAP, "normalize_tip_stiffness", "Convert tip stiffness description to standard enum."
+)
 
 
 def safe_float(val) -> Optional[float]:
     """Safely convert a value to float, returning None on failure."""
     if val is None or (isinstance(val, float) and pd.isna(val)):
         return None
+    # Plain numbers need no parsing, so skip the exception handler
+    if isinstance(val, (int, float)):
+        return float(val)
     try:
         return float(val)
     except (ValueError, TypeError):
         return None
 
 
+def _first(row: dict, field: str, default=None):
+    """First truthy value in ``row`` among the field's column aliases."""
+    for key in COLUMN_ALIASES[field]:
+        value = row.get(key)
+        if value:
+            return value
+    return default
+
+
+def _first_str(row: dict, field: str, default: str) -> str:
+    """Like _first, converting to str only when the value is not one already."""
+    value = _first(row, field, default)
+    return value if isinstance(value, str) else str(value)
+
+
 def normalize_row(row: dict, manufacturer: str, club_type: ClubType) -> ShaftSpec:
     """
     Normalize a single row of raw shaft data into a ShaftSpec.
@@ -139,64 +247,36 @@ def normalize_row(row: dict, manufacturer: str, club_type: ClubType) -> ShaftSpe
     Handles variations in column naming across manufacturers.
     """
     # Extract model name — try common column names
-    model = str(
-        row.get("model")
-        or row.get("shaft")
-        or row.get("name")
-        or row.get("product")
-        or "Unknown"
-    ).strip()
-
-    generation = row.get("generation") or row.get("gen") or row.get("version")
+    model = _first_str(row, "model", "Unknown").strip()
+
+    generation = _first(row, "generation")
     if generation:
         generation = str(generation).strip()
 
-    # Flex
-    flex_raw = str(
-        row.get("flex") or row.get("stiffness") or row.get("Flex") or "S"
-    )
-    flex = normalize_flex(flex_raw)
+    flex = normalize_flex(_first_str(row, "flex", "S"))
 
-    # Weight
-    weight = safe_float(
-        row.get("weight") or row.get("weight_grams") or row.get("wt")
-    )
+    weight = safe_float(_first(row, "weight_grams"))
     if weight is None:
         raise ValueError(f"Missing weight for {model}")
 
-    # Length
-    length = safe_float(
-        row.get("length") or row.get("length_inches") or row.get("raw_length")
-    )
-
-    # Torque
-    torque = safe_float(
-        row.get("torque") or row.get("torque_degrees")
-    )
+    length = safe_float(_first(row, "length_inches"))
+    torque = safe_float(_first(row, "torque_degrees"))
 
     # Launch, spin, kickpoint
-    launch = normalize_launch(
-        row.get("launch") or row.get("launch_profile")
-    )
-    spin = normalize_spin(
-        row.get("spin") or row.get("spin_profile")
-    )
-    kickpoint = normalize_kickpoint(
-        row.get("kickpoint") or row.get("kick_point") or row.get("bend_point")
-    )
-    tip_stiff = normalize_tip_stiffness(
-        row.get("tip_stiff") or row.get("tip_stiffness") or row.get("tip")
-    )
+    launch = normalize_launch(_first(row, "launch"))
+    spin = normalize_spin(_first(row, "spin"))
+    kickpoint = normalize_kickpoint(_first(row, "kickpoint"))
+    tip_stiff = normalize_tip_stiffness(_first(row, "tip_stiff"))
 
     # Diameters
-    butt_dia = safe_float(row.get("butt_diameter") or row.get("butt"))
-    tip_dia = safe_float(row.get("tip_diameter") or row.get("tip_dia"))
+    butt_dia = safe_float(_first(row, "butt_diameter_inches"))
+    tip_dia = safe_float(_first(row, "tip_diameter_inches"))
 
     # Material
     material = str(row.get("material", "graphite")).strip().lower()
 
     # Price
-    msrp = safe_float(row.get("msrp") or row.get("msrp_usd") or row.get("price"))
+    msrp = safe_float(_first(row, "msrp_usd"))
 
     return ShaftSpec(
         manufacturer=manufacturer,
@@ -218,32 +298,290 @@ def normalize_row(row: dict, manufacturer: str, club_type: ClubType) -> ShaftSpe
     )
 
 
+def standardize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Strip, lowercase and underscore column names, interned.
+
+    The names are kept in an object Index (the pandas 3 str Index does not
+    preserve identity), so row dicts share keys with the alias literals.
+    Columns whose names collide are coalesced into one.
+    """
+    names = df.columns.astype(str).str.strip().str.lower().str.replace(" ", "_")
+    if names.has_duplicates:
+        # e.g. "Model" and "model": keep the first non-missing value per row
+        df = pd.DataFrame(
+            {
+                name: df.loc[:, names == name].bfill(axis=1).iloc[:, 0]
+                for name in names.unique()
+            },
+            index=df.index,
+        )
+        names = names.unique()
+    df.columns = pd.Index([sys.intern(name) for name in names], dtype=object)
+    return df
+
+
+def resolve_columns(columns) -> dict[str, list[str]]:
+    """Map each ShaftSpec field to the raw columns present for it, in lookup order."""
+    present = set(columns)
+    resolved = {}
+    for field, aliases in COLUMN_ALIASES.items():
+        cols = [c for c in aliases if c in present]
+        if cols:
+            resolved[field] = cols
+    return resolved
+
+
+def _canonical_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Raw values under canonical field names, with aliases resolved once.
+
+    Fields backed by a single column are a rename; several alias columns are
+    coalesced to the first non-missing value per row.
+    """
+    resolved = resolve_columns(df.columns)
+    renames = {cols[0]: field for field, cols in resolved.items() if len(cols) == 1}
+    frame = df[list(renames)].rename(columns=renames)
+    for field, cols in resolved.items():
+        if len(cols) > 1:
+            frame[field] = df[cols].bfill(axis=1).iloc[:, 0]
+    return frame
+
+
+def _column(frame: pd.DataFrame, field: str) -> pd.Series:
+    if field in frame.columns:
+        return frame[field]
+    return pd.Series(np.nan, index=frame.index, dtype=object)
+
+
+def _to_str(series: pd.Series) -> pd.Series:
+    """Stripped Arrow-backed strings, so str ops run in Arrow's kernels; missing stays missing."""
+    return series.astype("string[pyarrow]").str.strip()
+
+
+def _to_float(series: pd.Series) -> pd.Series:
+    """One to_numeric scan per column instead of safe_float per cell."""
+    return pd.to_numeric(series, errors="coerce").astype(float)
+
+
+def _lookup(series: pd.Series, mapping: dict) -> pd.Series:
+    """
+    Map values through ``mapping`` once per distinct value.
+
+    The result is object dtype so enum members survive (pandas would
+    otherwise infer a plain string column).
+    """
+    codes, uniques = pd.factorize(series)
+    table = np.array([mapping.get(value) for value in uniques] + [None], dtype=object)
+    return pd.Series(table[codes], index=series.index, dtype=object)
+
+
+# Constraint attribute -> rows that break it (pydantic stores Field bounds as
+# annotated-types objects exposing these attributes)
+_CONSTRAINT_CHECKS = {
+    "gt": lambda series, bound: series <= bound,
+    "ge": lambda series, bound: series < bound,
+    "lt": lambda series, bound: series >= bound,
+    "le": lambda series, bound: series > bound,
+    "min_length": lambda series, bound: series.str.len() < bound,
+}
+
+
+def _violates(series: pd.Series, constraint) -> pd.Series:
+    """Rows of ``series`` that break a pydantic field constraint."""
+    for attr, check in _CONSTRAINT_CHECKS.items():
+        bound = getattr(constraint, attr, None)
+        if bound is not None:
+            return check(series, bound)
+    raise TypeError(f"Unsupported ShaftSpec constraint: {constraint!r}")
+
+
+def _enum_value(value):
+    return value.value if isinstance(value, Enum) else value
+
+
+def _map_lower(series: pd.Series, mapping: dict) -> pd.Series:
+    return _lookup(series.str.lower(), mapping)
+
+
+def _normalize_fields(
+    df: pd.DataFrame, manufacturer: str
+) -> tuple[pd.DataFrame, dict[int, str]]:
+    """
+    Column-wise core shared by the normalize_dataframe variants.
+
+    Returns the normalized field columns (enum columns hold enum members) and
+    the rows that fail a check, as ``{position: message}``.
+    """
+    source = _canonical_frame(df)
+
+    # Pre-cast once: text fields to Arrow strings, numeric fields to float
+    text = {field: _to_str(_column(source, field)) for field in TEXT_FIELDS}
+    numeric = {field: _to_float(_column(source, field)) for field in NUMERIC_FIELDS}
+
+    model = text["model"].fillna("Unknown")
+    # Default to Stiff only when the sheet has no flex column; blank cells are rejected
+    flex_raw = text["flex"] if "flex" in source.columns else text["flex"].fillna("S")
+
+    # Flex: direct map, then suffix extraction over the misses only
+    flex_key = flex_raw.str.lower().str.replace(" ", "")
+    flex = _lookup(flex_key, FLEX_MAP)
+    misses = flex.isna().to_numpy()
+    if misses.any():
+        suffix = flex_key[misses].str.extract(_FLEX_SUFFIX_PATTERN, expand=False)
+        values = flex.to_numpy(copy=True)
+        values[misses] = _lookup(suffix, FLEX_MAP).to_numpy()
+        flex = pd.Series(values, index=flex.index, dtype=object)
+
+    fields = pd.DataFrame({
+        "model": model,
+        "generation": text["generation"],
+        "flex": flex,
+        "launch": _map_lower(text["launch"], LAUNCH_MAP),
+        "spin": _map_lower(text["spin"], SPIN_MAP),
+        "tip_stiff": _map_lower(text["tip_stiff"], TIP_STIFF_MAP),
+        "kickpoint": _map_lower(text["kickpoint"], KICKPOINT_MAP),
+        "material": text["material"].fillna("graphite").str.lower(),
+        **numeric,
+    })
+
+    # Rows that fail a check, by position (first failure wins)
+    row_errors: dict[int, str] = {}
+    for pos in np.flatnonzero(fields["flex"].isna().to_numpy()):
+        if pd.isna(flex_raw.iat[pos]):
+            row_errors[pos] = f"Missing flex for {model.iat[pos]}"
+        else:
+            row_errors[pos] = f"Cannot normalize flex: '{flex_raw.iat[pos]}'"
+    for pos in np.flatnonzero(fields["weight_grams"].isna().to_numpy()):
+        row_errors.setdefault(pos, f"Missing weight for {model.iat[pos]}")
+
+    # The ShaftSpec field constraints, checked column-wise (missing values pass)
+    for name, constraints in FIELD_CONSTRAINTS.items():
+        if name == "manufacturer":
+            column = pd.Series(manufacturer, index=fields.index)
+        else:
+            column = fields[name]
+        invalid = np.zeros(len(fields), dtype=bool)
+        for constraint in constraints:
+            invalid |= _violates(column, constraint).to_numpy(dtype=bool, na_value=False)
+        for pos in np.flatnonzero(invalid):
+            value = column.iat[pos]
+            if isinstance(value, np.generic):
+                value = value.item()
+            row_errors.setdefault(pos, f"Invalid {name}: {value!r}")
+
+    return fields, row_errors
+
+
+def _report(
+    df: pd.DataFrame,
+    row_errors: dict[int, str],
+    n_valid: int,
+    manufacturer: str,
+    club_type: ClubType,
+) -> None:
+    """Log the failed rows (first five) and print the normalized count."""
+    if row_errors and logger.isEnabledFor(logging.WARNING):
+        failed = sorted(row_errors.items())
+        details = "".join(f"\n   Row {df.index[pos]}: {msg}" for pos, msg in failed[:5])
+        if len(failed) > 5:
+            details += f"\n   ... and {len(failed) - 5} more"
+        logger.warning(
+            "%d rows failed normalization for %s:%s", len(failed), manufacturer, details
+        )
+
+    print(f"✅ Normalized {n_valid} shafts for {manufacturer} ({club_type.value})")
+
+
 def normalize_dataframe(
     df: pd.DataFrame,
     manufacturer: str,
     club_type: ClubType,
-) -> list[ShaftSpec]:
+    raw: bool = False,
+) -> Union[list[ShaftSpec], list[ShaftSpecRaw]]:
     """
     Normalize an entire DataFrame of raw shaft data.
 
-    Returns a list of valid ShaftSpec objects. Logs warnings for rows that fail validation.
+    Column aliases, text mappings, numeric coercion and the ShaftSpec range
+    checks are applied column-wise; rows that pass are built with
+    ``ShaftSpec.model_construct``, skipping per-row pydantic validation.
+
+    Returns a list of valid ShaftSpec objects (slotted ShaftSpecRaw objects
+    with ``raw=True``). Logs warnings for rows that fail validation.
     """
-    specs = []
-    errors = []
+    manufacturer = manufacturer.strip()
+    fields, row_errors = _normalize_fields(df, manufacturer)
+    values = fields.astype(object).where(fields.notna(), None)
+    names = list(values.columns)
+
+    # Plain row tuples (no per-row Series), zipped with the field names once per row
+    build = ShaftSpecRaw if raw else ShaftSpec.model_construct
+    specs = [
+        build(manufacturer=manufacturer, club_type=club_type, **dict(zip(names, row)))
+        for pos, row in enumerate(values.itertuples(index=False, name=None))
+        if pos not in row_errors
+    ]
+
+    _report(df, row_errors, len(specs), manufacturer, club_type)
+    return specs
 
-    for idx, row in df.iterrows():
-        try:
-            spec = normalize_row(row.to_dict(), manufacturer, club_type)
-            specs.append(spec)
-        except (ValueError, KeyError) as e:
-            errors.append(f"Row {idx}: {e}")
 
-    if errors:
-        print(f"⚠️  {len(errors)} rows failed normalization for {manufacturer}:")
-        for err in errors[:5]:
-            print(f"   {err}")
-        if len(errors) > 5:
-            print(f"   ... and {len(errors) - 5} more")
+def normalize_dataframe_columnar(
+    df: pd.DataFrame,
+    manufacturer: str,
+    club_type: ClubType,
+) -> pd.DataFrame:
+    """
+    Normalize a DataFrame of raw shaft data into a DataFrame of valid specs.
 
-    print(f"✅ Normalized {len(specs)} shafts for {manufacturer} ({club_type.value})")
-    return specs
+    Same rules as normalize_dataframe, but the result stays columnar: one column
+    per ShaftSpec field, with enum fields as categoricals (see ENUM_DTYPES),
+    manufacturer as a categorical and rows that fail validation dropped (the
+    original index is kept).
+    """
+    manufacturer = manufacturer.strip()
+    fields, row_errors = _normalize_fields(df, manufacturer)
+
+    keep = np.ones(len(fields), dtype=bool)
+    keep[list(row_errors)] = False
+    fields = fields[keep]
+
+    result = pd.DataFrame(index=fields.index)
+    for name in ShaftSpec.model_fields:
+        if name == "manufacturer":
+            column = pd.Series(manufacturer, index=fields.index)
+        elif name == "club_type":
+            column = pd.Series(club_type.value, index=fields.index)
+        else:
+            column = fields[name]
+        if name in ENUM_DTYPES:
+            column = (
+                column.astype("category")
+                .cat.rename_categories(_enum_value)
+                .astype(ENUM_DTYPES[name])
+            )
+        elif name == "manufacturer":
+            column = column.astype("category")
+        result[name] = column
+
+    _report(df, row_errors, len(result), manufacturer, club_type)
+    return result
+
+
+def normalize_json(
+    raw_bytes: bytes,
+    manufacturer: str,
+    club_type: ClubType,
+    raw: bool = False,
+) -> Union[list[ShaftSpec], list[ShaftSpecRaw]]:
+    """
+    Normalize a JSON array of raw shaft records (as bytes).
+
+    Records use the same column names and aliases as the CSV spec sheets.
+    Parsed with orjson, then normalized like normalize_dataframe.
+    """
+    records = orjson.loads(raw_bytes)
+    if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+        raise ValueError("Expected a JSON array of shaft record objects")
+    df = standardize_columns(pd.DataFrame.from_records(records))
+    return normalize_dataframe(df, manufacturer, club_type, raw=raw)
@@ -1,5 +1,6 @@
 """Data models and validation for golf shaft specifications."""
 
+from dataclasses import dataclass, fields
 from enum import Enum
 from typing import Optional
 
@@ -65,6 +66,14 @@ class Kickpoint(str, Enum):
     HIGH = "High"
 
 
+def format_display_name(
+    manufacturer: str, model: str, generation: Optional[str], flex: str
+) -> str:
+    """Human-readable shaft identifier built from raw field values."""
+    gen = f" {generation}" if generation else ""
+    return f"{manufacturer} {model}{gen} {flex}"
+
+
 class ShaftSpec(BaseModel):
     """Normalized golf shaft specification."""
 
@@ -93,10 +102,61 @@ class ShaftSpec(BaseModel):
     @property
     def flex_order(self) -> int:
         """Numeric flex ordering for sorting."""
-        return FLEX_ORDER.get(self.flex, 3)
+        return FLEX_ORDER[self.flex]
+
+    @property
+    def display_name(self) -> str:
+        """Human-readable shaft identifier."""
+        return format_display_name(
+            self.manufacturer, self.model, self.generation, self.flex.value
+        )
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ShaftSpecRaw:
+    """
+    Lightweight, unvalidated ShaftSpec for bulk pipelines.
+
+    Slotted and immutable; promote with ``to_spec()`` where validation is needed.
+    """
+
+    manufacturer: str
+    model: str
+    generation: Optional[str] = None
+    club_type: ClubType
+    flex: Flex
+    weight_grams: float
+    length_inches: Optional[float] = None
+    torque_degrees: Optional[float] = None
+    launch: Optional[LaunchProfile] = None
+    spin: Optional[SpinProfile] = None
+    butt_diameter_inches: Optional[float] = None
+    tip_diameter_inches: Optional[float] = None
+    tip_stiff: Optional[TipStiffness] = None
+    kickpoint: Optional[Kickpoint] = None
+    material: str = "graphite"
+    msrp_usd: Optional[float] = None
+
+    @property
+    def flex_order(self) -> int:
+        """Numeric flex ordering for sorting."""
+        return FLEX_ORDER[self.flex]
 
     @property
     def display_name(self) -> str:
         """Human-readable shaft identifier."""
-        gen = f" {self.generation}" if self.generation else ""
-        return f"{self.manufacturer} {self.model}{gen} {self.flex.value}"
+        return format_display_name(
+            self.manufacturer, self.model, self.generation, self.flex.value
+        )
+
+    def to_dict(self) -> dict:
+        """JSON-ready dict, matching ``ShaftSpec.model_dump(mode="json")``."""
+        data = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            data[f.name] = value.value if isinstance(value, Enum) else value
+        return data
+
+    def to_spec(self) -> ShaftSpec:
+        """Validated pydantic ShaftSpec with the same values."""
+        return ShaftSpec(**{f.name: getattr(self, f.name) for f in fields(self)})
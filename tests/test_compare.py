@@ -0,0 +1,140 @@
+"""Tests for shaft filtering and comparison."""
+
+import json
+
+import pandas as pd
+import pytest
+
+from src.analysis.compare import (
+    compare_shafts,
+    downsample,
+    filter_mask,
+    filter_shafts,
+    weight_progression,
+)
+from src.ingestion.load_data import load_database_df
+
+
+@pytest.fixture
+def shafts() -> pd.DataFrame:
+    return pd.DataFrame({
+        "manufacturer": ["Project X", "Fujikura", "KBS", "Fujikura"],
+        "model": ["HZRDUS Black", "Ventus Blue", "Tour", "Ventus Red"],
+        "club_type": ["woods", "woods", "iron", "woods"],
+        "flex": ["Stiff", "X-Stiff", "Stiff", "Regular"],
+        "weight_grams": [62.0, 67.0, 120.0, 55.0],
+        "torque_degrees": [3.5, 3.0, None, 4.5],
+        "launch": ["Low", "Mid", "Mid", "High"],
+        "spin": ["Low", "Low", None, "Mid"],
+        "kickpoint": ["Mid", "Mid", "Mid", "Low"],
+        "tip_stiff": ["Firm", "Firm", None, "Soft"],
+        "length_inches": [46.0, 46.0, None, 46.0],
+        "tip_diameter_inches": [0.335, 0.335, 0.355, 0.335],
+        "butt_diameter_inches": [0.62, 0.62, None, 0.6],
+        "material": ["graphite", "graphite", "steel", "graphite"],
+        "msrp_usd": [350.0, 350.0, None, 300.0],
+    })
+
+
+class TestFilterShafts:
+    def test_no_filters_returns_input(self, shafts):
+        assert filter_shafts(shafts) is shafts
+
+    def test_categorical_filters(self, shafts):
+        result = filter_shafts(shafts, manufacturers=["Fujikura"], flexes=["Regular"])
+        assert result["model"].tolist() == ["Ventus Red"]
+
+    def test_weight_range(self, shafts):
+        result = filter_shafts(shafts, weight_min=60, weight_max=100)
+        assert result["model"].tolist() == ["HZRDUS Black", "Ventus Blue"]
+
+    def test_torque_excludes_missing(self, shafts):
+        result = filter_shafts(shafts, torque_max=4.0)
+        assert result["model"].tolist() == ["HZRDUS Black", "Ventus Blue"]
+
+    def test_price_excludes_missing(self, shafts):
+        result = filter_shafts(shafts, price_max=320)
+        assert result["model"].tolist() == ["Ventus Red"]
+
+    def test_works_on_categorical_columns(self, shafts):
+        shafts["manufacturer"] = shafts["manufacturer"].astype("category")
+        result = filter_shafts(shafts, manufacturers=["KBS"], club_types=["iron"])
+        assert result["model"].tolist() == ["Tour"]
+
+
+class TestFilterMask:
+    def test_no_filters(self, shafts):
+        assert filter_mask(shafts) is None
+
+    def test_positional_mask(self, shafts):
+        mask = filter_mask(shafts, club_types=["woods"], weight_max=65)
+        assert mask.tolist() == [True, False, False, True]
+
+
+class TestCompareShafts:
+    def test_empty(self, shafts):
+        assert compare_shafts(shafts.iloc[:0]).empty
+
+    def test_columns_are_shafts(self, shafts):
+        rows = shafts.set_index(shafts["manufacturer"] + " " + shafts["model"]).iloc[:3]
+        result = compare_shafts(rows)
+        assert list(result.columns) == ["Project X HZRDUS Black", "Fujikura Ventus Blue", "KBS Tour"]
+        assert result.loc["Weight (g)"].tolist() == [62.0, 67.0, 120.0]
+        assert result.loc["Torque (°)"].tolist() == [3.5, 3.0, "N/A"]
+        assert result.loc["Spin"].tolist() == ["Low", "Low", "N/A"]
+        assert result.loc["Club Type"].tolist() == ["Woods", "Woods", "Iron"]
+        assert result.loc["MSRP"].tolist() == ["$350", "$350", "N/A"]
+
+
+class TestWeightProgression:
+    def test_flex_order_on_loaded_database(self, tmp_path):
+        records = [
+            {"manufacturer": "Fujikura", "model": "Ventus Blue", "club_type": "woods",
+             "flex": flex, "weight_grams": weight}
+            for flex, weight in [("TX", 70.0), ("Stiff", 62.0), ("X-Stiff", 66.0), ("Regular", 58.0)]
+        ]
+        path = tmp_path / "db.json"
+        path.write_text(json.dumps(records))
+        df = load_database_df(path)
+        assert df["flex"].dtype.name == "category"
+
+        result = weight_progression(df, "Fujikura", "Ventus Blue")
+        assert result["flex"].tolist() == ["Regular", "Stiff", "X-Stiff", "TX"]
+
+
+class TestDownsample:
+    def test_small_frame_unchanged(self, shafts):
+        assert downsample(shafts, 10, by="manufacturer") is shafts
+
+    def test_stratified_sample(self):
+        df = pd.DataFrame({
+            "manufacturer": ["A"] * 300 + ["B"] * 100,
+            "weight_grams": range(400),
+        })
+        sample = downsample(df, 100, by="manufacturer")
+        assert sample["manufacturer"].value_counts().to_dict() == {"A": 75, "B": 25}
+        assert sample.equals(downsample(df, 100, by="manufacturer"))
+
+    def test_small_groups_keep_a_point(self):
+        df = pd.DataFrame({
+            "manufacturer": ["A"] * 9998 + ["B"] * 2,
+            "weight_grams": range(10000),
+        })
+        sample = downsample(df, 2000, by="manufacturer")
+        assert len(sample) == 2000
+        assert sample["manufacturer"].value_counts().to_dict() == {"A": 1999, "B": 1}
+
+    def test_never_exceeds_max_points(self):
+        df = pd.DataFrame({
+            "manufacturer": [f"M{i}" for i in range(3000) for _ in range(3)],
+            "weight_grams": range(9000),
+        })
+        assert len(downsample(df, 2000, by="manufacturer")) == 2000
+
+    def test_categorical_groups(self):
+        df = pd.DataFrame({
+            "manufacturer": pd.Categorical(["A"] * 50 + ["B"] * 50, categories=["A", "B", "C"]),
+            "weight_grams": range(100),
+        })
+        sample = downsample(df, 10, by="manufacturer")
+        assert sample["manufacturer"].value_counts().to_dict() == {"A": 5, "B": 5, "C": 0}
@@ -0,0 +1,158 @@
+"""Tests for loading the processed shaft database."""
+
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from src.ingestion.load_data import (
+    CATEGORICAL_COLUMNS,
+    SEARCH_COLUMN,
+    detect_club_type,
+    load_and_normalize,
+    load_database_df,
+    load_filter_options,
+    save_database,
+)
+from src.ingestion.schemas import ClubType, Flex, ShaftSpec
+
+SAMPLE_RECORDS = [
+    {
+        "manufacturer": "Project X", "model": "HZRDUS Black", "generation": "Gen 4",
+        "club_type": "woods", "flex": "Stiff", "weight_grams": 62.0,
+        "length_inches": 46.0, "torque_degrees": 3.5, "launch": "Low", "spin": "Low",
+        "butt_diameter_inches": 0.62, "tip_diameter_inches": 0.335,
+        "tip_stiff": "Firm", "kickpoint": "Mid", "material": "graphite", "msrp_usd": 350.0,
+    },
+    {
+        "manufacturer": "KBS", "model": "Tour", "generation": None,
+        "club_type": "iron", "flex": "Regular", "weight_grams": 120.0,
+        "length_inches": None, "torque_degrees": None, "launch": "Mid", "spin": None,
+        "butt_diameter_inches": None, "tip_diameter_inches": 0.355,
+        "tip_stiff": None, "kickpoint": "Mid", "material": "steel", "msrp_usd": None,
+    },
+]
+
+
+def write_db(path, records=SAMPLE_RECORDS):
+    path.write_text(json.dumps(records))
+    return path
+
+
+class TestLoadDatabaseDf:
+    def test_missing_file(self, tmp_path):
+        assert load_database_df(tmp_path / "missing.json").empty
+
+    def test_categorical_columns(self, tmp_path):
+        df = load_database_df(write_db(tmp_path / "db.json"))
+        assert len(df) == 2
+        for col in CATEGORICAL_COLUMNS:
+            assert df[col].dtype.name == "category"
+        assert df["weight_grams"].dtype.kind == "f"
+        assert df["manufacturer"].cat.ordered
+        assert df["model"].cat.categories.tolist() == ["HZRDUS Black", "Tour"]
+
+    @pytest.mark.parametrize("parquet", [False, True])
+    def test_enum_columns_use_enum_order(self, tmp_path, parquet):
+        path = tmp_path / "db.json"
+        if parquet:
+            save_database([ShaftSpec(**record) for record in SAMPLE_RECORDS], path)
+        else:
+            write_db(path)
+        df = load_database_df(path)
+        assert df["flex"].cat.ordered
+        assert df["flex"].cat.categories.tolist() == [flex.value for flex in Flex]
+        assert df["flex"].sort_values().tolist() == ["Regular", "Stiff"]
+        assert not df["club_type"].cat.ordered
+
+    def test_reads_parquet_copy_written_by_save(self, tmp_path):
+        path = tmp_path / "db.json"
+        save_database([ShaftSpec(**record) for record in SAMPLE_RECORDS], path)
+        assert path.with_suffix(".parquet").exists()
+
+        df = load_database_df(path)
+        assert df["model"].tolist() == ["HZRDUS Black", "Tour"]
+        assert df["flex"].dtype.name == "category"
+        assert pd.isna(df["torque_degrees"].iloc[1])
+
+    def test_indexed_by_display_name(self, tmp_path):
+        df = load_database_df(write_db(tmp_path / "db.json"))
+        assert df.index.tolist() == ["Project X HZRDUS Black Gen 4 Stiff", "KBS Tour Regular"]
+        assert df["display_name"].tolist() == df.index.tolist()
+
+    def test_search_column(self, tmp_path):
+        df = load_database_df(write_db(tmp_path / "db.json"))
+        assert df[SEARCH_COLUMN].tolist() == ["project x hzrdus black", "kbs tour"]
+
+    def test_cached_until_file_changes(self, tmp_path):
+        path = write_db(tmp_path / "db.json")
+        first = load_database_df(path)
+        assert load_database_df(path) is first
+
+        write_db(path, SAMPLE_RECORDS[:1])
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert len(load_database_df(path)) == 1
+
+
+class TestLoadFilterOptions:
+    def test_sorted_options(self, tmp_path):
+        options = load_filter_options(write_db(tmp_path / "db.json"))
+        assert options["manufacturers"] == ["KBS", "Project X"]
+        assert options["club_types"] == ["iron", "woods"]
+        assert options["display_names"] == [
+            "KBS Tour Regular",
+            "Project X HZRDUS Black Gen 4 Stiff",
+        ]
+
+
+class TestDetectClubType:
+    def test_groups_by_normalized_club_type(self):
+        df = pd.DataFrame({"club_type": ["Woods ", "iron", "woods"]}, index=[5, 6, 7])
+        groups = detect_club_type(df)
+        assert list(groups["woods"]) == [5, 7]
+        assert list(groups["iron"]) == [6]
+
+    def test_defaults_to_woods(self):
+        df = pd.DataFrame({"model": ["A", "B"]})
+        assert list(detect_club_type(df)["woods"]) == [0, 1]
+
+
+class TestLoadAndNormalize:
+    def test_groups_by_manufacturer_and_club_type(self, tmp_path):
+        csv = tmp_path / "specs.csv"
+        csv.write_text(
+            "Manufacturer,Model,Club Type,Flex,Weight\n"
+            "Project X,HZRDUS Black,woods,Stiff,62\n"
+            "KBS,Tour,iron,S,120\n"
+            "Project X,LZ,Iron,R,115\n"
+        )
+        specs = load_and_normalize(csv)
+        by_name = {s.display_name: s for s in specs}
+        assert len(specs) == 3
+        assert by_name["Project X HZRDUS Black Stiff"].club_type == ClubType.WOODS
+        assert by_name["Project X LZ Regular"].club_type == ClubType.IRON
+        assert by_name["KBS Tour Stiff"].club_type == ClubType.IRON
+
+    def test_orders_by_manufacturer_then_club_type_appearance(self, tmp_path):
+        csv = tmp_path / "specs.csv"
+        csv.write_text(
+            "Manufacturer,Model,Club Type,Flex,Weight\n"
+            "Project X,LZ,iron,R,115\n"
+            "KBS,Tour,iron,S,120\n"
+            "Project X,HZRDUS Black,woods,Stiff,62\n"
+            "Project X,Rifle,iron,X,125\n"
+        )
+        assert [s.display_name for s in load_and_normalize(csv)] == [
+            "KBS Tour Stiff",
+            "Project X LZ Regular",
+            "Project X Rifle X-Stiff",
+            "Project X HZRDUS Black Stiff",
+        ]
+
+    def test_requires_manufacturer_column(self, tmp_path):
+        csv = tmp_path / "specs.csv"
+        csv.write_text("Model,Flex,Weight\nTour,S,120\n")
+        with pytest.raises(ValueError):
+            load_and_normalize(csv)
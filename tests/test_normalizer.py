@@ -1,14 +1,35 @@
 """Tests for shaft data normalization."""
 
+import pandas as pd
 import pytest
 
+from pydantic import ValidationError
+
 from src.ingestion.normalizer import (
+    FIELD_CONSTRAINTS,
+    normalize_dataframe,
+    normalize_dataframe_columnar,
+    normalize_json,
     normalize_flex,
     normalize_kickpoint,
     normalize_launch,
+    normalize_row,
     normalize_spin,
+    normalize_tip_stiffness,
+    resolve_columns,
+    safe_float,
+    standardize_columns,
+)
+from src.ingestion.schemas import (
+    ClubType,
+    Flex,
+    Kickpoint,
+    LaunchProfile,
+    ShaftSpec,
+    ShaftSpecRaw,
+    SpinProfile,
+    TipStiffness,
 )
-from src.ingestion.schemas import Flex, Kickpoint, LaunchProfile, SpinProfile
 
 
 class TestNormalizeFlex:
@@ -35,6 +56,12 @@ class TestNormalizeFlex:
         assert normalize_flex("6.0S") == Flex.STIFF
         assert normalize_flex("60X") == Flex.X_STIFF
         assert normalize_flex("5.5R") == Flex.REGULAR
+        assert normalize_flex("60TX") == Flex.TX
+        assert normalize_flex("6.5xs") == Flex.X_STIFF
+
+    def test_suffix_requires_number(self):
+        with pytest.raises(ValueError):
+            normalize_flex("bogus")
 
     def test_invalid_flex(self):
         with pytest.raises(ValueError):
@@ -80,3 +107,226 @@ class TestNormalizeKickpoint:
 
     def test_none_handling(self):
         assert normalize_kickpoint(None) is None
+
+
+class TestNormalizeTipStiffness:
+    def test_standard_values(self):
+        assert normalize_tip_stiffness(" Very Firm ") == TipStiffness.VERY_FIRM
+        assert normalize_tip_stiffness("med") == TipStiffness.MEDIUM
+
+    def test_none_handling(self):
+        assert normalize_tip_stiffness(None) is None
+        assert normalize_tip_stiffness(float("nan")) is None
+
+
+class TestStandardizeColumns:
+    def test_names(self):
+        df = standardize_columns(pd.DataFrame(columns=[" Club Type", "MSRP"]))
+        assert list(df.columns) == ["club_type", "msrp"]
+
+    def test_colliding_names_coalesced(self):
+        df = pd.DataFrame([["A", None], [None, "B"]], columns=["Model", "model"])
+        assert standardize_columns(df)["model"].tolist() == ["A", "B"]
+
+
+class TestSafeFloat:
+    def test_values(self):
+        assert safe_float(62) == 62.0
+        assert safe_float("3.5") == 3.5
+        assert safe_float("n/a") is None
+        assert safe_float(float("nan")) is None
+        assert safe_float(None) is None
+
+
+class TestNormalizeDataframe:
+    def test_alias_columns(self):
+        df = pd.DataFrame({
+            "shaft": ["Ventus Blue", "Tour AD"],
+            "stiffness": ["X-Stiff", "6.0S"],
+            "weight": [None, 65],
+            "weight_grams": [67.0, None],
+            "kick_point": ["Mid", "Front"],
+            "price": ["350", "n/a"],
+        })
+        specs = normalize_dataframe(df, "Fujikura", ClubType.WOODS)
+        assert [s.display_name for s in specs] == [
+            "Fujikura Ventus Blue X-Stiff",
+            "Fujikura Tour AD Stiff",
+        ]
+        assert specs[0].weight_grams == 67.0
+        assert specs[1].flex is Flex.STIFF
+        assert specs[0].kickpoint == Kickpoint.MID
+        assert specs[0].msrp_usd == 350.0
+        assert specs[1].kickpoint == Kickpoint.LOW
+        assert specs[1].msrp_usd is None
+        assert specs[1].material == "graphite"
+
+    def test_defaults(self):
+        df = pd.DataFrame({"model": ["Tour"], "weight": [120]})
+        (spec,) = normalize_dataframe(df, "KBS", ClubType.IRON)
+        assert spec.flex == Flex.STIFF
+        assert spec.generation is None
+        assert spec.launch is None
+
+    def test_invalid_rows_skipped(self):
+        df = pd.DataFrame({
+            "model": ["Good", "Bad Flex", "No Weight"],
+            "flex": ["R", "banana", "S"],
+            "weight": [60, 60, None],
+        })
+        specs = normalize_dataframe(df, "Test", ClubType.WOODS)
+        assert [s.model for s in specs] == ["Good"]
+
+    def test_blank_flex_rejected(self, caplog):
+        df = pd.DataFrame({"model": ["A", "B"], "flex": ["R", None], "weight": [60, 60]})
+        specs = normalize_dataframe(df, "Test", ClubType.WOODS)
+        assert [s.model for s in specs] == ["A"]
+        assert "Row 1: Missing flex for B" in caplog.text
+        with pytest.raises(ValueError):
+            normalize_row({"model": "B", "flex": float("nan"), "weight": 60}, "Test", ClubType.WOODS)
+
+    def test_failures_logged(self, caplog):
+        df = pd.DataFrame({"model": ["Bad"], "flex": ["banana"], "weight": [60]})
+        normalize_dataframe(df, "Test", ClubType.WOODS)
+        assert "1 rows failed normalization for Test" in caplog.text
+        assert "Row 0: Cannot normalize flex: 'banana'" in caplog.text
+
+    def test_out_of_range_rows_skipped(self):
+        df = pd.DataFrame({
+            "model": ["Good", "Heavy", "Torque", "Long", "Price"],
+            "weight": [60, 400, 60, 60, 60],
+            "torque": [3.5, 3.5, 20, 3.5, 3.5],
+            "length": [46, 46, 46, 70, 46],
+            "msrp": [300, 300, 300, 300, -1],
+        })
+        specs = normalize_dataframe(df, "Test", ClubType.WOODS)
+        assert [s.model for s in specs] == ["Good"]
+
+    @pytest.mark.parametrize(
+        "column,field",
+        [
+            ("weight", "weight_grams"),
+            ("length", "length_inches"),
+            ("torque", "torque_degrees"),
+            ("msrp", "msrp_usd"),
+        ],
+    )
+    def test_bounds_match_schema(self, column, field):
+        assert field in FIELD_CONSTRAINTS
+        values = [-1.0, 0.0, 0.5, 14.99, 15.0, 59.99, 60.0, 299.99, 300.0, 5000.0]
+        base = {"weight": 60.0}
+        for value in values:
+            row = {"model": "A", **base, column: value}
+            specs = normalize_dataframe(pd.DataFrame([row]), "Test", ClubType.WOODS)
+            try:
+                ShaftSpec(manufacturer="Test", model="A", club_type=ClubType.WOODS,
+                          flex=Flex.STIFF, **{"weight_grams": 60.0, field: value})
+                valid = True
+            except ValidationError:
+                valid = False
+            assert bool(specs) == valid, (field, value)
+
+    def test_invalid_value_message(self, caplog):
+        df = pd.DataFrame({"model": ["A"], "weight": [60], "torque": [-1]})
+        normalize_dataframe(df, "Test", ClubType.WOODS)
+        assert "Invalid torque_degrees: -1.0" in caplog.text
+
+    def test_specs_match_validated_construction(self):
+        df = pd.DataFrame({
+            "model": [" Tour AD "],
+            "flex": ["6.0S"],
+            "weight": [65],
+            "launch": ["Mid/High"],
+            "tip": ["Firm"],
+        })
+        (spec,) = normalize_dataframe(df, " Graphite Design ", ClubType.WOODS)
+        assert spec == ShaftSpec(**spec.model_dump())
+        assert spec.manufacturer == "Graphite Design"
+        assert spec.flex is Flex.STIFF
+        assert isinstance(spec.weight_grams, float)
+
+    def test_raw_specs(self):
+        df = pd.DataFrame({"model": ["Tour"], "flex": ["R"], "weight": [120]})
+        (spec,) = normalize_dataframe(df, "KBS", ClubType.IRON, raw=True)
+        assert isinstance(spec, ShaftSpecRaw)
+        assert spec.to_spec() == normalize_dataframe(df, "KBS", ClubType.IRON)[0]
+
+
+class TestNormalizeDataframeColumnar:
+    def test_matches_spec_list(self):
+        df = pd.DataFrame({
+            "model": ["Ventus Blue", "Bad", "Tour AD"],
+            "flex": ["X", "banana", "6.0S"],
+            "weight": [67, 60, 65],
+            "launch": ["Mid", "Low", None],
+        })
+        result = normalize_dataframe_columnar(df, "Fujikura", ClubType.WOODS)
+        specs = normalize_dataframe(df, "Fujikura", ClubType.WOODS)
+        assert list(result.columns) == list(ShaftSpec.model_fields)
+        assert result.index.tolist() == [0, 2]
+        assert result.astype(object).where(result.notna(), None).to_dict(
+            orient="records"
+        ) == [spec.model_dump(mode="json") for spec in specs]
+
+    def test_categorical_columns(self):
+        df = pd.DataFrame({"model": ["A", "B"], "flex": ["S", "R"], "weight": [60, 55]})
+        result = normalize_dataframe_columnar(df, "Test", ClubType.WOODS)
+        assert result["flex"].dtype.name == "category"
+        assert result["club_type"].dtype.name == "category"
+        assert result.loc[result["flex"] == Flex.STIFF, "model"].tolist() == ["A"]
+
+    def test_enum_categories_ordered(self):
+        df = pd.DataFrame({"model": ["A", "B", "C"], "flex": ["X", "L", "R"], "weight": [60] * 3})
+        result = normalize_dataframe_columnar(df, "Test", ClubType.WOODS)
+        assert result["flex"].cat.categories.tolist() == [f.value for f in Flex]
+        assert result.sort_values("flex")["model"].tolist() == ["B", "C", "A"]
+        assert result.loc[result["flex"] > Flex.REGULAR, "model"].tolist() == ["A"]
+        assert not result["club_type"].cat.ordered
+
+
+class TestNormalizeRow:
+    def test_validated(self):
+        spec = normalize_row({"model": "Tour", "weight": "120"}, "KBS", ClubType.IRON)
+        assert spec.weight_grams == 120.0
+
+    def test_non_string_values(self):
+        spec = normalize_row({"model": 790, "flex": None, "weight": 60}, "Test", ClubType.WOODS)
+        assert spec.model == "790"
+        assert spec.flex == Flex.STIFF
+
+    def test_aliases(self):
+        row = {"shaft": "Ventus", "stiffness": "X", "wt": 67, "kick_point": "Mid"}
+        spec = normalize_row(row, " Fujikura ", ClubType.WOODS)
+        assert spec.display_name == "Fujikura Ventus X-Stiff"
+        assert spec.kickpoint == Kickpoint.MID
+
+    def test_out_of_range_rejected(self):
+        with pytest.raises(ValueError):
+            normalize_row({"model": "A", "weight": 500, "flex": "S"}, "X", ClubType.WOODS)
+
+
+class TestResolveColumns:
+    def test_aliases_in_lookup_order(self):
+        resolved = resolve_columns(["wt", "weight", "shaft", "manufacturer"])
+        assert resolved == {"weight_grams": ["weight", "wt"], "model": ["shaft"]}
+
+
+class TestNormalizeJson:
+    def test_records(self):
+        data = b'[{"Model": "Tour", "Flex": "S", "Weight": 120, "Launch": "Mid"}, {"model": "Bad"}]'
+        specs = normalize_json(data, "KBS", ClubType.IRON)
+        assert [s.display_name for s in specs] == ["KBS Tour Stiff"]
+        assert specs[0].launch == LaunchProfile.MID
+
+    def test_empty(self):
+        assert normalize_json(b"[]", "KBS", ClubType.IRON) == []
+
+    def test_requires_array(self):
+        with pytest.raises(ValueError):
+            normalize_json(b'{"model": "Tour"}', "KBS", ClubType.IRON)
+
+    def test_requires_objects(self):
+        with pytest.raises(ValueError):
+            normalize_json(b"[1, 2]", "KBS", ClubType.IRON)
+        with pytest.raises(ValueError):
+            normalize_json(b'[{"model": "Tour", "weight": 120}, "Tour"]', "KBS", ClubType.IRON)
@@ -3,7 +3,14 @@
 import pytest
 from pydantic import ValidationError
 
-from src.ingestion.schemas import ClubType, Flex, LaunchProfile, ShaftSpec
+from src.ingestion.schemas import (
+    ClubType,
+    Flex,
+    LaunchProfile,
+    ShaftSpec,
+    ShaftSpecRaw,
+    format_display_name,
+)
 
 
 class TestShaftSpec:
@@ -41,6 +48,12 @@ class TestShaftSpec:
         )
         assert spec.display_name == "KBS Tour Stiff"
 
+    def test_display_name_from_raw_fields(self):
+        assert format_display_name("Fujikura", "Ventus Blue", "TR", "X-Stiff") == (
+            "Fujikura Ventus Blue TR X-Stiff"
+        )
+        assert format_display_name("KBS", "Tour", None, "Stiff") == "KBS Tour Stiff"
+
     def test_flex_order(self):
         spec_s = ShaftSpec(
             manufacturer="Test", model="Test", club_type=ClubType.WOODS,
@@ -73,3 +86,35 @@ class TestShaftSpec:
         )
         assert spec.manufacturer == "Fujikura"
         assert spec.model == "Ventus"
+
+
+class TestShaftSpecRaw:
+    def make(self, **overrides):
+        values = dict(
+            manufacturer="Fujikura",
+            model="Ventus",
+            generation="TR",
+            club_type=ClubType.WOODS,
+            flex=Flex.X_STIFF,
+            weight_grams=67.0,
+            launch=LaunchProfile.LOW,
+        )
+        values.update(overrides)
+        return ShaftSpecRaw(**values)
+
+    def test_slotted_and_frozen(self):
+        raw = self.make()
+        assert not hasattr(raw, "__dict__")
+        with pytest.raises(AttributeError):
+            raw.weight_grams = 70.0
+
+    def test_matches_shaft_spec(self):
+        raw = self.make()
+        spec = raw.to_spec()
+        assert raw.display_name == spec.display_name == "Fujikura Ventus TR X-Stiff"
+        assert raw.flex_order == spec.flex_order
+        assert raw.to_dict() == spec.model_dump(mode="json")
+
+    def test_to_spec_validates(self):
+        with pytest.raises(ValidationError):
+            self.make(weight_grams=0).to_spec()